@@ -1,12 +1,14 @@
 """Cache manager for AI model responses with LRU and Redis support."""
 
+import gzip
 import hashlib
-import json
 import logging
 from functools import lru_cache
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -16,6 +18,77 @@ except ImportError:
     REDIS_AVAILABLE = False
     logger.warning("redis package not available. Install with: pip install redis")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class _SemanticIndex:
+    """
+    Bounded in-memory vector index of (normalized embedding, value).
+
+    Vectors live in one matrix (grown by doubling) so a lookup is a single
+    matrix-vector product (cosine similarity); once max_size is reached,
+    the oldest entries are overwritten.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._vectors: Optional["np.ndarray"] = None
+        self._values: List[Dict[str, Any]] = []
+        self._count = 0
+        self._next = 0
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional["np.ndarray"]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def search(self, embedding: List[float], threshold: float) -> Optional[Dict[str, Any]]:
+        """Return the value of the most similar entry if its similarity >= threshold."""
+        if self._count == 0:
+            return None
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != self._vectors.shape[1]:
+            return None
+        similarities = self._vectors[:self._count] @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < threshold:
+            return None
+        return self._values[best]
+
+    def add(self, embedding: List[float], value: Dict[str, Any]):
+        """Insert an entry, evicting the oldest one when full."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        if self._vectors is None:
+            self._vectors = np.zeros((min(64, self.max_size), vector.shape[0]), dtype=np.float32)
+        elif vector.shape[0] != self._vectors.shape[1]:
+            return  # embedding model changed; ignore mismatched vectors
+        elif self._count == len(self._vectors) < self.max_size:
+            # Grow by doubling until max_size
+            grown = np.zeros((min(2 * self._count, self.max_size), vector.shape[0]), dtype=np.float32)
+            grown[:self._count] = self._vectors
+            self._vectors = grown
+
+        if self._count < self.max_size:
+            position = self._count
+            self._values.append(value)
+            self._count += 1
+        else:
+            # Full: overwrite the oldest entry
+            position = self._next
+            self._values[position] = value
+            self._next = (self._next + 1) % self.max_size
+        self._vectors[position] = vector
+
+    def __len__(self) -> int:
+        return self._count
+
 
 class CacheManager:
     """
@@ -30,6 +103,8 @@ class CacheManager:
     - TTL support for cache expiration
     - Cache hit/miss metrics
     - Graceful fallback to memory if Redis unavailable
+    - Optional semantic tier: near-duplicate signals (by embedding cosine
+      similarity) reuse a cached response; kept in process memory per ICP
     """
 
     def __init__(
@@ -38,6 +113,7 @@ class CacheManager:
         redis_url: Optional[str] = None,
         max_size: int = 1000,
         ttl_seconds: int = 2592000,  # 30 days
+        semantic_max_size: int = 5000,
     ):
         """
         Initialize cache manager.
@@ -47,6 +123,7 @@ class CacheManager:
             redis_url: Redis connection URL (required for redis backend)
             max_size: Maximum cache entries for LRU (memory backend)
             ttl_seconds: Time-to-live for cache entries in seconds
+            semantic_max_size: Maximum embeddings kept per ICP in the semantic tier
         """
         self.backend = backend
         self.max_size = max_size
@@ -56,6 +133,11 @@ class CacheManager:
         # Metrics
         self.hits = 0
         self.misses = 0
+        self.semantic_hits = 0
+
+        # Semantic tier: one vector index per ICP context key
+        self.semantic_max_size = semantic_max_size
+        self._semantic_indexes: Dict[str, _SemanticIndex] = {}
 
         # In-memory cache (dict for LRU cache simulation)
         self._memory_cache: Dict[str, Dict[str, Any]] = {}
@@ -78,11 +160,8 @@ class CacheManager:
         """Connect to Redis (call during app startup)."""
         if self.backend == "redis" and REDIS_AVAILABLE and self.redis_url:
             try:
-                self.redis_client = await aioredis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True
-                )
+                # Values are gzip-compressed JSON, so keep responses as bytes
+                self.redis_client = await aioredis.from_url(self.redis_url)
                 # Test connection
                 await self.redis_client.ping()
                 logger.info(f"Successfully connected to Redis at {self.redis_url}")
@@ -121,6 +200,18 @@ class CacheManager:
         cache_key = hashlib.sha256(key_string.encode()).hexdigest()
         return f"model_cache:{cache_key}"
 
+    @staticmethod
+    def _encode_value(value: Dict[str, Any]) -> bytes:
+        """Serialize a response for Redis as gzip-compressed JSON."""
+        return gzip.compress(orjson.dumps(value), compresslevel=6)
+
+    @staticmethod
+    def _decode_value(raw: bytes) -> Dict[str, Any]:
+        """Inverse of _encode_value; also accepts plain JSON written by older versions."""
+        if raw[:2] == b"\x1f\x8b":  # gzip magic number
+            raw = gzip.decompress(raw)
+        return orjson.loads(raw)
+
     async def get(
         self,
         signal_text: str,
@@ -147,7 +238,7 @@ class CacheManager:
                 if cached_value:
                     self.hits += 1
                     logger.debug(f"Cache HIT (Redis): {cache_key[:16]}...")
-                    return json.loads(cached_value)
+                    return self._decode_value(cached_value)
                 else:
                     self.misses += 1
                     logger.debug(f"Cache MISS (Redis): {cache_key[:16]}...")
@@ -203,7 +294,7 @@ class CacheManager:
                 await self.redis_client.setex(
                     cache_key,
                     ttl,
-                    json.dumps(value)
+                    self._encode_value(value)
                 )
                 logger.debug(f"Cache SET (Redis): {cache_key[:16]}... (TTL={ttl}s)")
             else:
@@ -222,6 +313,125 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Cache SET error: {e}")
 
+    async def get_many(
+        self,
+        signal_texts: List[str],
+        icp_context: Optional[str] = None,
+        model: str = "1b"
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve cached responses for several signals.
+
+        On Redis this is a single MGET round trip instead of one GET per signal.
+
+        Returns:
+            Cached response dicts (None where missing), aligned with signal_texts
+        """
+        if not (self.backend == "redis" and self.redis_client):
+            return [await self.get(text, icp_context, model) for text in signal_texts]
+        if not signal_texts:
+            return []
+
+        cache_keys = [self._generate_cache_key(text, icp_context, model) for text in signal_texts]
+        try:
+            cached_values = await self.redis_client.mget(cache_keys)
+        except Exception as e:
+            logger.error(f"Cache MGET error: {e}")
+            self.misses += len(signal_texts)
+            return [None] * len(signal_texts)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for cached_value in cached_values:
+            if cached_value:
+                self.hits += 1
+                results.append(self._decode_value(cached_value))
+            else:
+                self.misses += 1
+                results.append(None)
+        logger.debug(f"Cache MGET (Redis): {len(signal_texts)} keys, {sum(r is not None for r in results)} hits")
+        return results
+
+    async def set_many(
+        self,
+        items: List[Tuple[str, Dict[str, Any]]],
+        icp_context: Optional[str] = None,
+        model: str = "1b",
+        ttl: Optional[int] = None
+    ):
+        """
+        Store several (signal_text, value) responses.
+
+        On Redis the SETEX commands are sent in one pipelined round trip.
+        """
+        if not (self.backend == "redis" and self.redis_client):
+            for signal_text, value in items:
+                await self.set(signal_text, value, icp_context, model, ttl)
+            return
+        if not items:
+            return
+
+        ttl = ttl or self.ttl_seconds
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for signal_text, value in items:
+                    pipe.setex(self._generate_cache_key(signal_text, icp_context, model), ttl, self._encode_value(value))
+                await pipe.execute()
+            logger.debug(f"Cache SET MANY (Redis): {len(items)} keys (TTL={ttl}s)")
+        except Exception as e:
+            logger.error(f"Cache SET MANY error: {e}")
+
+    def get_semantic(
+        self,
+        embedding: List[float],
+        icp_context: Optional[str] = None,
+        threshold: float = 0.92,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the cached response of the most similar earlier signal.
+
+        Args:
+            embedding: Embedding of the signal text
+            icp_context: Optional ICP context (entries are only shared within one ICP)
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            Cached response dict or None if nothing is similar enough
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+        index = self._semantic_indexes.get(icp_context or "")
+        if index is None:
+            return None
+
+        try:
+            value = index.search(embedding, threshold)
+        except Exception as e:
+            logger.error(f"Semantic cache GET error: {e}")
+            return None
+        if value is not None:
+            self.semantic_hits += 1
+            logger.debug("Cache HIT (Semantic)")
+        return value
+
+    def set_semantic(
+        self,
+        embedding: List[float],
+        value: Dict[str, Any],
+        icp_context: Optional[str] = None,
+    ):
+        """Store a response in the semantic tier, keyed on the signal embedding."""
+        if not NUMPY_AVAILABLE:
+            return
+        partition = icp_context or ""
+        index = self._semantic_indexes.get(partition)
+        if index is None:
+            index = self._semantic_indexes[partition] = _SemanticIndex(self.semantic_max_size)
+
+        try:
+            index.add(embedding, value)
+        except Exception as e:
+            logger.error(f"Semantic cache SET error: {e}")
+
     async def invalidate(
         self,
         signal_text: str,
@@ -244,6 +454,7 @@ class CacheManager:
 
     async def clear_all(self):
         """Clear all cache entries."""
+        self._semantic_indexes.clear()
         try:
             if self.backend == "redis" and self.redis_client:
                 # Only clear keys with our prefix
@@ -276,6 +487,8 @@ class CacheManager:
             "misses": self.misses,
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
+            "semantic_hits": self.semantic_hits,
+            "semantic_entries": sum(len(index) for index in self._semantic_indexes.values()),
             "cache_size": len(self._memory_cache) if self.backend == "memory" else "N/A (Redis)",
             "max_size": self.max_size if self.backend == "memory" else "N/A (Redis)",
             "ttl_seconds": self.ttl_seconds
@@ -295,7 +508,8 @@ def init_cache_manager(
     backend: str = "memory",
     redis_url: Optional[str] = None,
     max_size: int = 1000,
-    ttl_seconds: int = 2592000
+    ttl_seconds: int = 2592000,
+    semantic_max_size: int = 5000
 ) -> CacheManager:
     """Initialize the singleton cache manager."""
     global _cache_manager
@@ -303,6 +517,7 @@ def init_cache_manager(
         backend=backend,
         redis_url=redis_url,
         max_size=max_size,
-        ttl_seconds=ttl_seconds
+        ttl_seconds=ttl_seconds,
+        semantic_max_size=semantic_max_size
     )
     return _cache_manager
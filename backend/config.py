@@ -1,7 +1,8 @@
 """Configuration for the Raptorflow Lead Engine."""
 
 import os
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     """App settings loaded from env vars."""
@@ -13,12 +14,16 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./raptorflow_leads.db")
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "10"))  # Ignored for SQLite
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    sqlite_busy_timeout: float = float(os.getenv("SQLITE_BUSY_TIMEOUT", "30"))  # Seconds a SQLite writer waits for the lock ("database is locked")
 
     # Ollama
     ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     ollama_model_1b: str = os.getenv("OLLAMA_MODEL_1B", "gemma3:1b")
     ollama_model_4b: str = os.getenv("OLLAMA_MODEL_4B", "gemma3:4b")
     ollama_embedding_model: str = os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text")
+    ollama_keep_alive: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # Keep models (and prompt-prefix KV cache) loaded between calls
 
     # Alternative Model Support (Mistral, Llama, etc.)
     enable_alternative_models: bool = os.getenv("ENABLE_ALTERNATIVE_MODELS", "false").lower() == "true"
@@ -32,7 +37,10 @@ class Settings(BaseSettings):
 
     # Classifiers
     classifier_score_threshold: int = 70  # Only generate 4B dossier for leads > this score
+    dossier_concurrency_limit: int = int(os.getenv("DOSSIER_CONCURRENCY_LIMIT", "2"))  # Max concurrent 4B dossier calls
     prefilter_score_threshold: int = int(os.getenv("PREFILTER_SCORE_THRESHOLD", "20"))  # Multi-stage: skip 4B if below this
+    enable_keyword_prefilter: bool = os.getenv("ENABLE_KEYWORD_PREFILTER", "true").lower() == "true"  # Batch: skip LLM if no ICP keyword in text
+    icp_context_ttl_seconds: int = int(os.getenv("ICP_CONTEXT_TTL_SECONDS", "60"))  # Re-check ICP table for other workers' edits
 
     # Model Parameters - Dynamic Context Windows
     context_window_1b_short: int = int(os.getenv("CONTEXT_WINDOW_1B_SHORT", "4096"))  # For short text (<500 chars)
@@ -50,6 +58,7 @@ class Settings(BaseSettings):
     cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", "2592000"))  # 30 days default
     cache_max_size: int = int(os.getenv("CACHE_MAX_SIZE", "1000"))  # LRU cache max entries
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    crawl_cache_ttl_seconds: int = int(os.getenv("CRAWL_CACHE_TTL_SECONDS", "86400"))  # Reuse a site's crawl for a day; 0 disables
 
     # Streaming Configuration
     enable_streaming: bool = os.getenv("ENABLE_STREAMING", "false").lower() == "true"
@@ -58,6 +67,9 @@ class Settings(BaseSettings):
     # Batch Processing
     batch_concurrency_limit: int = int(os.getenv("BATCH_CONCURRENCY_LIMIT", "5"))  # Max concurrent requests
     batch_enable_parallel: bool = os.getenv("BATCH_ENABLE_PARALLEL", "true").lower() == "true"
+    batch_prompt_size: int = int(os.getenv("BATCH_PROMPT_SIZE", "5"))  # Signals classified per 1B prompt
+    max_batch_size: int = int(os.getenv("MAX_BATCH_SIZE", "1000"))  # Larger batch requests are rejected (413)
+    ocr_concurrency_limit: int = int(os.getenv("OCR_CONCURRENCY_LIMIT", str(min(4, os.cpu_count() or 1))))  # Scanned PDF pages OCR'd at once (pair with OMP_THREAD_LIMIT=1)
 
     # Health Monitoring
     enable_health_monitoring: bool = os.getenv("ENABLE_HEALTH_MONITORING", "true").lower() == "true"
@@ -68,11 +80,17 @@ class Settings(BaseSettings):
     enable_embeddings: bool = os.getenv("ENABLE_EMBEDDINGS", "false").lower() == "true"
     embedding_similarity_threshold: float = float(os.getenv("EMBEDDING_SIMILARITY_THRESHOLD", "0.7"))
     embedding_cache_ttl: int = int(os.getenv("EMBEDDING_CACHE_TTL", "604800"))  # 7 days
+    enable_semantic_cache: bool = os.getenv("ENABLE_SEMANTIC_CACHE", "false").lower() == "true"  # Needs ENABLE_EMBEDDINGS
+    semantic_cache_threshold: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))  # Cosine similarity for a hit
+    semantic_cache_max_size: int = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "5000"))  # Embeddings kept per ICP
 
     # Prompt Templates
     prompt_template_path: str = os.getenv("PROMPT_TEMPLATE_PATH", "./prompts")
     enable_custom_prompts: bool = os.getenv("ENABLE_CUSTOM_PROMPTS", "false").lower() == "true"
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (env is read once)."""
+    return Settings()
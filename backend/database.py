@@ -1,10 +1,16 @@
 """Database models and initialization."""
 
+import logging
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, JSON, create_engine
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, JSON, Index, create_engine, delete, func, insert, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateColumn
+from config import Settings, get_settings
 
+logger = logging.getLogger(__name__)
 Base = declarative_base()
 
 class ICPProfile(Base):
@@ -47,6 +53,7 @@ class Company(Base):
     state = Column(String, nullable=True)
     country = Column(String, default="india")
     sector = Column(String, nullable=True)
+    career_page_url = Column(String, nullable=True)  # Found by the website scraper
 
     # Inferred
     marketing_stack_guess = Column(Text, nullable=True)
@@ -59,6 +66,12 @@ class Company(Base):
     signals = relationship("Signal", back_populates="company")
     leads = relationship("Lead", back_populates="company")
 
+    __table_args__ = (
+        # Case-insensitive name lookups (func.lower(Company.name) == ...); unique so
+        # concurrent get-or-create inserts conflict instead of duplicating a company
+        Index("ix_companies_lower_name", func.lower(name), unique=True),
+    )
+
 class Contact(Base):
     """Individual contact."""
     __tablename__ = "contacts"
@@ -88,7 +101,8 @@ class Signal(Base):
     source_type = Column(String, index=True)  # "job_post", "website", "ocr", "manual", "csv"
     source_url = Column(String, nullable=True)
     raw_text = Column(Text)
-    metadata = Column(JSON, default={})
+    # "metadata" is reserved on declarative models; the column keeps its name
+    extra_metadata = Column("metadata", JSON, default={})
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -100,7 +114,7 @@ class Lead(Base):
     __tablename__ = "leads"
 
     id = Column(Integer, primary_key=True, index=True)
-    company_id = Column(Integer, ForeignKey("companies.id"))
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True)
     contact_id = Column(Integer, ForeignKey("contacts.id"), nullable=True)
 
     # Scoring
@@ -142,6 +156,13 @@ class Lead(Base):
     contact = relationship("Contact", back_populates="leads")
     activities = relationship("Activity", back_populates="lead")
 
+    __table_args__ = (
+        # Lead list filtered by status, hottest first (ORDER BY total_score DESC LIMIT n)
+        Index("ix_leads_status_total_score", status, total_score),
+        # Same for the score_bucket filter (the lead list's bucket tabs)
+        Index("ix_leads_score_bucket_total_score", score_bucket, total_score),
+    )
+
 class Activity(Base):
     """Activity log per lead (calls, messages, notes, tasks)."""
     __tablename__ = "activities"
@@ -154,6 +175,86 @@ class Activity(Base):
 
     lead = relationship("Lead", back_populates="activities")
 
+def create_db_engine(settings: Settings):
+    """Create the SQLAlchemy engine, pooling connections for server databases."""
+    if settings.database_url.startswith("sqlite"):
+        # SQLite allows one writer at a time; concurrent sessions wait for the lock
+        return create_engine(
+            settings.database_url,
+            connect_args={"check_same_thread": False, "timeout": settings.sqlite_busy_timeout},
+        )
+
+    return create_engine(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+    )
+
+engine = create_db_engine(get_settings())
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING (any unique constraint)
+_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+def company_insert(db):
+    """INSERT into companies that skips rows clashing with lower(name) or website, where supported."""
+    dialect_insert = _CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        return insert(Company)
+    return dialect_insert(Company).on_conflict_do_nothing()
+
+def get_db():
+    """FastAPI dependency: one session per request, closed when the response is done."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def merge_case_duplicate_companies(conn):
+    """
+    Merge companies whose names differ only by case into the oldest of them.
+
+    Databases created before ix_companies_lower_name became unique may hold
+    such duplicates, on which creating the index would fail. Their contacts,
+    signals and leads are moved to the kept company before the rest are deleted.
+    """
+    lower_name = func.lower(Company.name)
+    duplicated = conn.execute(
+        select(lower_name).group_by(lower_name).having(func.count(Company.id) > 1)
+    ).scalars().all()
+    for name in duplicated:
+        (keep_id, keep_website), *merged = conn.execute(
+            select(Company.id, Company.website).where(lower_name == name).order_by(Company.id)
+        ).all()
+        merged_ids = [company_id for company_id, _ in merged]
+        for model in (Contact, Signal, Lead):
+            conn.execute(
+                update(model).where(model.company_id.in_(merged_ids)).values(company_id=keep_id)
+            )
+        conn.execute(delete(Company).where(Company.id.in_(merged_ids)))
+        # Keep a website only the merged rows had (website is unique, so after the delete)
+        website = keep_website or next((w for _, w in merged if w), None)
+        if website != keep_website:
+            conn.execute(update(Company).where(Company.id == keep_id).values(website=website))
+        logger.warning("Merged companies %s into %s (duplicate name %r)", merged_ids, keep_id, name)
+
 def init_db(engine):
-    """Create all tables."""
+    """Create all tables, plus any columns and indexes added to tables that already exist."""
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist: add their new (nullable)
+    # columns, and let the database skip the indexes it already has, since
+    # checkfirst doesn't see expression indexes on every backend.
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                    conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+        merge_case_duplicate_companies(conn)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
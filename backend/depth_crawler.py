@@ -85,12 +85,62 @@ class DepthLimitedCrawler:
             }
         """
         domain = self._get_domain(start_url)
+
+        logger.info(f"Starting crawl of {domain} (max {self.max_pages} pages, max depth {self.max_depth})")
+
+        # One client per crawl: every page is on the same domain, so requests
+        # reuse the pooled keep-alive connection instead of a new TCP+TLS handshake each
+        with httpx.Client(
+            headers={
+                'User-Agent': self.user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            },
+            timeout=self.timeout,
+            follow_redirects=True,
+        ) as client:
+            crawled_pages = self._crawl_pages(client, start_url, domain)
+
+        # Aggregate results
+        all_text_parts = []
+        all_emails = set()
+        all_phones = set()
+
+        for page in crawled_pages:
+            all_text_parts.append(f"=== {page['title']} ({page['url']}) ===\n{page['text']}")
+            all_emails.update(page['emails'])
+            all_phones.update(page['phones'])
+
+        result = {
+            'start_url': start_url,
+            'domain': domain,
+            'pages_crawled': len(crawled_pages),
+            'pages': [
+                {
+                    'url': p['url'],
+                    'title': p['title'],
+                    'text': p['text'],
+                    'emails': p['emails'],
+                    'phones': p['phones'],
+                }
+                for p in crawled_pages
+            ],
+            'all_text': '\n\n'.join(all_text_parts),
+            'all_emails': list(all_emails),
+            'all_phones': list(all_phones),
+        }
+
+        logger.info(f"Crawl complete. Visited {len(crawled_pages)} pages, found {len(all_emails)} emails, {len(all_phones)} phones")
+
+        return result
+
+    def _crawl_pages(self, client: httpx.Client, start_url: str, domain: str) -> List[Dict[str, Any]]:
+        """
+        Visit pages from start_url (priority links first) until max_pages are crawled.
+        """
         visited: Set[str] = set()
         to_visit: List[tuple] = [(start_url, 0)]  # (url, depth)
         crawled_pages = []
 
-        logger.info(f"Starting crawl of {domain} (max {self.max_pages} pages, max depth {self.max_depth})")
-
         while to_visit and len(crawled_pages) < self.max_pages:
             url, depth = to_visit.pop(0)
 
@@ -107,7 +157,7 @@ class DepthLimitedCrawler:
 
             # Fetch and parse page
             try:
-                page_data = self._fetch_and_parse_page(url)
+                page_data = self._fetch_and_parse_page(client, url)
                 if page_data:
                     crawled_pages.append(page_data)
                     logger.info(f"Crawled [{len(crawled_pages)}/{self.max_pages}]: {url}")
@@ -136,50 +186,14 @@ class DepthLimitedCrawler:
             except Exception as e:
                 logger.error(f"Error crawling {url}: {e}")
 
-        # Aggregate results
-        all_text_parts = []
-        all_emails = set()
-        all_phones = set()
-
-        for page in crawled_pages:
-            all_text_parts.append(f"=== {page['title']} ({page['url']}) ===\n{page['text']}")
-            all_emails.update(page['emails'])
-            all_phones.update(page['phones'])
+        return crawled_pages
 
-        result = {
-            'start_url': start_url,
-            'domain': domain,
-            'pages_crawled': len(crawled_pages),
-            'pages': [
-                {
-                    'url': p['url'],
-                    'title': p['title'],
-                    'text': p['text'],
-                    'emails': p['emails'],
-                    'phones': p['phones'],
-                }
-                for p in crawled_pages
-            ],
-            'all_text': '\n\n'.join(all_text_parts),
-            'all_emails': list(all_emails),
-            'all_phones': list(all_phones),
-        }
-
-        logger.info(f"Crawl complete. Visited {len(crawled_pages)} pages, found {len(all_emails)} emails, {len(all_phones)} phones")
-
-        return result
-
-    def _fetch_and_parse_page(self, url: str) -> Optional[Dict[str, Any]]:
+    def _fetch_and_parse_page(self, client: httpx.Client, url: str) -> Optional[Dict[str, Any]]:
         """
         Fetch and parse a single page.
         """
         try:
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-
-            response = httpx.get(url, headers=headers, timeout=self.timeout, follow_redirects=True)
+            response = client.get(url)
 
             if response.status_code != 200:
                 logger.warning(f"Non-200 status for {url}: {response.status_code}")
@@ -228,7 +242,7 @@ class DepthLimitedCrawler:
         """
         Extract all links from a page, filtering to same domain.
         """
-        links = []
+        links = set()
 
         for anchor in soup.find_all('a', href=True):
             href = anchor['href']
@@ -241,9 +255,9 @@ class DepthLimitedCrawler:
                 # Remove fragments
                 absolute_url = absolute_url.split('#')[0]
 
-                links.append(absolute_url)
+                links.add(absolute_url)
 
-        return list(set(links))  # Deduplicate
+        return list(links)  # Deduplicated by the set
 
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -266,7 +280,7 @@ class DepthLimitedCrawler:
 
     def _extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from text."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
         return list(set(re.findall(email_pattern, text)))
 
     def _extract_phones(self, text: str) -> List[str]:
@@ -277,10 +291,10 @@ class DepthLimitedCrawler:
             r'\b\d{10}\b',
             r'[6-9]\d{9}',
         ]
-        phones = []
+        phones = set()
         for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, text))
-        return list(set(phones))
+            phones.update(re.findall(pattern, text))
+        return list(phones)
 
 
 def summarize_crawled_text(crawled_data: Dict[str, Any], max_length: int = 5000) -> str:
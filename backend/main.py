@@ -6,12 +6,11 @@ Local Ollama-based lead discovery, classification, and enrichment.
 import os
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from database import init_db, Base
-from config import Settings
+from database import init_db, engine
+from config import get_settings
 from routers import icp, leads, ingest, classify, scrape, advanced_scraping
 from ollama_wrapper import init_ollama_manager, get_ollama_manager
 from cache_manager import init_cache_manager, get_cache_manager
@@ -19,12 +18,7 @@ from prompt_templates import init_prompt_manager, get_prompt_manager
 from scheduled_tasks import start_scheduler, stop_scheduler
 
 # Load settings
-settings = Settings()
-
-# Initialize database
-DATABASE_URL = settings.database_url
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,7 +33,8 @@ async def lifespan(app: FastAPI):
         backend=settings.cache_backend,
         redis_url=settings.redis_url if settings.cache_backend == "redis" else None,
         max_size=settings.cache_max_size,
-        ttl_seconds=settings.cache_ttl_seconds
+        ttl_seconds=settings.cache_ttl_seconds,
+        semantic_max_size=settings.semantic_cache_max_size
     )
     if settings.cache_backend == "redis":
         await cache_manager.connect_redis()
@@ -80,6 +75,11 @@ async def lifespan(app: FastAPI):
     stop_scheduler()
     print("✅ Scheduler stopped")
 
+    ollama_mgr = get_ollama_manager()
+    if ollama_mgr:
+        await ollama_mgr.close()
+        print("✅ Ollama client closed")
+
     # Disconnect Redis if used
     if settings.cache_backend == "redis":
         cache_mgr = get_cache_manager()
@@ -93,6 +93,7 @@ app = FastAPI(
     description="Overkill lead discovery + enrichment for marketing pain signals",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
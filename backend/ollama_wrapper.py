@@ -2,17 +2,32 @@
 
 import json
 import asyncio
+import hashlib
 import httpx
+import orjson
 import logging
 from typing import Optional, Dict, Any, AsyncIterator
 from datetime import datetime, timedelta
-from config import Settings
+from config import get_settings
 from cache_manager import get_cache_manager
 from prompt_templates import get_prompt_manager
 
 logger = logging.getLogger(__name__)
 
 
+def icp_cache_key(icp_context: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Canonical cache-key fragment for an ICP context.
+
+    Serializes with sorted keys and hashes to a short digest, so callers that
+    classify many signals against the same context can compute it once.
+    """
+    if not icp_context:
+        return None
+    blob = orjson.dumps(icp_context, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
 class ModelHealthMonitor:
     """Monitors Ollama model health and availability."""
 
@@ -96,7 +111,7 @@ class OllamaManager:
     """
 
     def __init__(self):
-        self.settings = Settings()
+        self.settings = get_settings()
         self.base_url = self.settings.ollama_base_url
 
         # Model selection (supports quantization and alternatives)
@@ -104,7 +119,13 @@ class OllamaManager:
         self.model_4b = self._select_model_4b()
         self.embedding_model = self.settings.ollama_embedding_model
 
-        self.client = httpx.AsyncClient(timeout=300)
+        # One pooled client for every Ollama call, sized so a full batch fan-out
+        # reuses keep-alive connections instead of reconnecting per signal
+        pool_size = self.settings.batch_concurrency_limit * 2
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(300, connect=5),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
 
         # Health monitoring
         if self.settings.enable_health_monitoring:
@@ -116,6 +137,12 @@ class OllamaManager:
         else:
             self.health_monitor = None
 
+        # (icp key, formatted ICP prompt section) of the last ICP seen
+        self._icp_prompt_cache: Optional[tuple[str, str]] = None
+
+        # classify_signal tasks in progress, keyed by (signal_text, icp key, use_cache)
+        self._inflight_classifications: Dict[tuple, asyncio.Future] = {}
+
         # Metrics
         self.classification_count = 0
         self.dossier_count = 0
@@ -155,6 +182,22 @@ class OllamaManager:
         else:
             return self.settings.context_window_1b_long
 
+    async def close(self):
+        """Close the pooled HTTP client (call during app shutdown)."""
+        await self.client.aclose()
+
+    def _connection_pool_stats(self) -> Dict[str, Any]:
+        """Snapshot of the HTTP connection pool, to confirm connections are reused."""
+        pool = getattr(getattr(self.client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return {}
+        return {
+            "max_connections": getattr(pool, "_max_connections", None),
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for conn in connections if conn.is_idle()),
+        }
+
     async def ensure_models_loaded(self):
         """Ensure all required models are available in Ollama."""
         try:
@@ -217,6 +260,7 @@ class OllamaManager:
         icp_context: Optional[Dict[str, Any]] = None,
         use_cache: bool = True,
         stream: bool = False,
+        icp_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Use 1B model to quickly classify a signal.
@@ -226,6 +270,7 @@ class OllamaManager:
             icp_context: Optional ICP context dict
             use_cache: Whether to use cache (default True)
             stream: Whether to stream the response (default False)
+            icp_key: Precomputed icp_cache_key(icp_context), if available
 
         Returns:
             Classification dict with scores, tags, SPIN fields
@@ -233,10 +278,34 @@ class OllamaManager:
         # Periodic health check
         await self._periodic_health_check()
 
+        # Coalesce concurrent calls for the same signal and ICP: they all await
+        # one shared task instead of racing past the cache to the model
+        icp_str = icp_key or icp_cache_key(icp_context)
+        inflight_key = (signal_text, icp_str, use_cache)
+        task = self._inflight_classifications.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._classify_signal(signal_text, icp_context, use_cache, icp_str)
+            )
+            self._inflight_classifications[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight_classifications.pop(inflight_key, None))
+        else:
+            logger.debug("Joining in-flight classification for identical signal")
+
+        # Shielded so one cancelled caller does not cancel the others' result
+        return await asyncio.shield(task)
+
+    async def _classify_signal(
+        self,
+        signal_text: str,
+        icp_context: Optional[Dict[str, Any]],
+        use_cache: bool,
+        icp_str: Optional[str],
+    ) -> Dict[str, Any]:
+        """Cache lookups and the 1B call behind classify_signal."""
         # Check cache first
         cache_manager = get_cache_manager()
         if use_cache and cache_manager and self.cache_enabled:
-            icp_str = json.dumps(icp_context) if icp_context else None
             cached_result = await cache_manager.get(
                 signal_text=signal_text,
                 icp_context=icp_str,
@@ -246,13 +315,20 @@ class OllamaManager:
                 logger.debug("Using cached classification result")
                 return cached_result
 
+        # Semantic tier: reuse the classification of a near-duplicate signal
+        embedding = None
+        if use_cache and cache_manager and self.cache_enabled:
+            embedding, semantic_result = await self._semantic_lookup(signal_text, icp_str)
+            if semantic_result:
+                logger.debug("Using semantically cached classification result")
+                return semantic_result
+
         # Build prompt from template
         prompt_manager = get_prompt_manager()
         if prompt_manager:
-            icp_context_str = self._format_icp_context(icp_context) if icp_context else "No ICP context provided."
             prompt = prompt_manager.render_template(
                 "classification",
-                icp_context=icp_context_str,
+                icp_context=self._icp_prompt_context(icp_context, icp_str),
                 signal_text=signal_text
             )
         else:
@@ -270,6 +346,7 @@ class OllamaManager:
                     "model": self.model_1b,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": self.settings.ollama_keep_alive,
                     "options": {
                         "temperature": self.settings.temperature_1b,
                         "top_p": 0.9,
@@ -287,13 +364,14 @@ class OllamaManager:
 
             # Cache the result
             if use_cache and cache_manager and self.cache_enabled:
-                icp_str = json.dumps(icp_context) if icp_context else None
                 await cache_manager.set(
                     signal_text=signal_text,
                     value=result,
                     icp_context=icp_str,
                     model="1b"
                 )
+                if embedding:
+                    cache_manager.set_semantic(embedding, result, icp_str)
 
             self.classification_count += 1
             return result
@@ -302,6 +380,135 @@ class OllamaManager:
             logger.error(f"Error in classify_signal: {e}")
             return self._default_classification()
 
+    async def classify_signals_batch(
+        self,
+        signal_texts: list[str],
+        icp_context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        icp_key: Optional[str] = None,
+    ) -> list[Dict[str, Any]]:
+        """
+        Use 1B model to classify several signals with a single prompt.
+
+        The ICP context and instructions are sent once for the whole group,
+        so the shared prompt prefix is evaluated once instead of per signal.
+        Cached signals are skipped; signals the model's reply does not cover
+        (or all of them, if it cannot be parsed) are classified individually.
+
+        Args:
+            signal_texts: Signal texts to classify
+            icp_context: Optional ICP context dict
+            use_cache: Whether to use cache (default True)
+            icp_key: Precomputed icp_cache_key(icp_context), if available
+
+        Returns:
+            Classification dicts, in the same order as signal_texts
+        """
+        await self._periodic_health_check()
+
+        cache_manager = get_cache_manager()
+        use_cache = use_cache and cache_manager is not None and self.cache_enabled
+        icp_str = (icp_key or icp_cache_key(icp_context)) if use_cache else None
+
+        results: list[Optional[Dict[str, Any]]] = [None] * len(signal_texts)
+        if use_cache:
+            results = await cache_manager.get_many(signal_texts, icp_context=icp_str, model="1b")
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        embeddings: Dict[int, list[float]] = {}
+        if use_cache and pending and self.settings.enable_semantic_cache:
+            lookups = await asyncio.gather(*(self._semantic_lookup(signal_texts[i], icp_str) for i in pending))
+            for i, (embedding, semantic_result) in zip(pending, lookups):
+                results[i] = semantic_result
+                if embedding and semantic_result is None:
+                    embeddings[i] = embedding
+            pending = [i for i in pending if results[i] is None]
+
+        if not pending:
+            return results
+
+        prompt_manager = get_prompt_manager()
+        batch_results = None
+        if len(pending) > 1 and prompt_manager:
+            signals_text = "\n\n".join(
+                f"### Signal {n}\n{signal_texts[i]}" for n, i in enumerate(pending, 1)
+            )
+            prompt = prompt_manager.render_template(
+                "classification_batch",
+                icp_context=self._icp_prompt_context(icp_context, icp_str),
+                signals_text=signals_text,
+                signal_count=len(pending),
+            )
+
+            try:
+                response = await self.client.post(
+                    f"{self.base_url}/api/generate",
+                    json={
+                        "model": self.model_1b,
+                        "prompt": prompt,
+                        "stream": False,
+                        "keep_alive": self.settings.ollama_keep_alive,
+                        "options": {
+                            "temperature": self.settings.temperature_1b,
+                            "top_p": 0.9,
+                            "top_k": 40,
+                            "num_ctx": self._calculate_context_window(signals_text),
+                        },
+                    },
+                )
+                response.raise_for_status()
+                response_text = response.json().get("response", "").strip()
+                batch_results = self._parse_json_array_response(response_text, len(pending))
+            except Exception as e:
+                logger.error(f"Error in classify_signals_batch: {e}")
+
+        if batch_results is None:
+            # Single signal, no template, or unusable batch output
+            batch_results = [None] * len(pending)
+
+        parsed = [(i, result) for i, result in zip(pending, batch_results) if result is not None]
+        for i, result in parsed:
+            results[i] = result
+            if use_cache and i in embeddings:
+                cache_manager.set_semantic(embeddings[i], result, icp_str)
+        if use_cache and parsed:
+            await cache_manager.set_many(
+                [(signal_texts[i], result) for i, result in parsed],
+                icp_context=icp_str,
+                model="1b"
+            )
+        self.classification_count += len(parsed)
+
+        # Classify one by one only what the batch prompt did not return
+        for i, result in zip(pending, batch_results):
+            if result is None:
+                results[i] = await self.classify_signal(
+                    signal_texts[i], icp_context, use_cache=use_cache, icp_key=icp_str
+                )
+        return results
+
+    async def _semantic_lookup(
+        self,
+        signal_text: str,
+        icp_str: Optional[str],
+    ) -> tuple[Optional[list[float]], Optional[Dict[str, Any]]]:
+        """
+        Embed a signal and look for a cached near-duplicate classification.
+
+        Returns (embedding, cached result); the embedding is None when the
+        semantic cache is disabled, so callers know not to store into it.
+        """
+        cache_manager = get_cache_manager()
+        if not (self.settings.enable_semantic_cache and cache_manager):
+            return None, None
+
+        embedding = await self.generate_embedding(signal_text)
+        if not embedding:
+            return None, None
+        return embedding, cache_manager.get_semantic(
+            embedding, icp_str, threshold=self.settings.semantic_cache_threshold
+        )
+
     async def generate_dossier(
         self,
         lead_json: Dict[str, Any],
@@ -348,6 +555,7 @@ class OllamaManager:
                     "model": self.model_4b,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": self.settings.ollama_keep_alive,
                     "options": {
                         "temperature": self.settings.temperature_4b,
                         "top_p": 0.9,
@@ -461,6 +669,22 @@ class OllamaManager:
             logger.error(f"Error computing similarity: {e}")
             return 0.0
 
+    def _icp_prompt_context(self, icp_context: Optional[Dict[str, Any]], icp_str: Optional[str]) -> str:
+        """
+        ICP section of the classification prompts, formatted once per ICP key.
+
+        The prompts put this block right after the fixed instructions, so
+        every call for the same ICP shares a byte-identical prefix that
+        Ollama can reuse from its KV cache while the model stays loaded.
+        """
+        if not icp_context:
+            return "No ICP context provided."
+        if icp_str is None:
+            return self._format_icp_context(icp_context)
+        if self._icp_prompt_cache is None or self._icp_prompt_cache[0] != icp_str:
+            self._icp_prompt_cache = (icp_str, self._format_icp_context(icp_context))
+        return self._icp_prompt_cache[1]
+
     def _format_icp_context(self, icp_context: Dict[str, Any]) -> str:
         """Format ICP context for prompt."""
         return f"""
@@ -543,6 +767,56 @@ Return STRICT JSON with these fields:
                 logger.warning(f"No JSON found in response: {response_text[:200]}")
                 return default
 
+    def _parse_json_array_response(self, response_text: str, expected_len: int) -> Optional[list]:
+        """
+        Parse a batch classification array from model response.
+
+        Objects carrying an "index" (1-based signal number) are routed to that
+        position, so a short or reordered array still yields the signals it
+        covers; without indexes the array must have exactly `expected_len`
+        objects. Returns a list of `expected_len` dicts or None (missing
+        signals), or None if nothing usable was returned.
+        """
+        try:
+            data = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Try to find the array in the response
+            start_idx = response_text.find("[")
+            end_idx = response_text.rfind("]") + 1
+            if start_idx < 0 or end_idx <= start_idx:
+                logger.warning(f"No JSON array found in response: {response_text[:200]}")
+                return None
+            try:
+                data = json.loads(response_text[start_idx:end_idx])
+            except json.JSONDecodeError:
+                logger.warning(f"Could not parse JSON array from response: {response_text[:200]}")
+                return None
+
+        # Some models wrap the array in an object, e.g. {"results": [...]}
+        if isinstance(data, dict):
+            data = next((v for v in data.values() if isinstance(v, list)), None)
+
+        if not isinstance(data, list) or not data or not all(isinstance(d, dict) for d in data):
+            logger.warning("Batch response did not contain classification objects")
+            return None
+
+        indexes = [d.get("index") for d in data]
+        if all(isinstance(n, int) and 1 <= n <= expected_len for n in indexes) and len(set(indexes)) == len(indexes):
+            routed: list[Optional[Dict[str, Any]]] = [None] * expected_len
+            for n, d in zip(indexes, data):
+                d.pop("index")
+                routed[n - 1] = d
+            if len(data) != expected_len:
+                logger.warning(f"Batch response covered {len(data)} of {expected_len} signals")
+            return routed
+
+        if len(data) != expected_len:
+            logger.warning(f"Batch response did not contain {expected_len} classification objects")
+            return None
+        for d in data:
+            d.pop("index", None)
+        return data
+
     def _default_classification(self) -> Dict[str, Any]:
         """Default classification when model fails."""
         return {
@@ -586,6 +860,7 @@ Return STRICT JSON with these fields:
             "dossier_count": self.dossier_count,
             "embedding_count": self.embedding_count,
             "cache_enabled": self.cache_enabled,
+            "http_pool": self._connection_pool_stats(),
         }
 
         # Add health stats if monitoring enabled
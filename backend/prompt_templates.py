@@ -83,6 +83,46 @@ Analyze the signal and return a JSON object with the following structure. Be pre
 
 Return ONLY the JSON object, no additional text."""
 
+        # Batched classification template (1B model, several signals per prompt)
+        self.templates["classification_batch"] = """You are an expert lead qualification analyst. Your job is to analyze social media signals (posts, comments, job ads, etc.) and classify each of them according to an Ideal Customer Profile (ICP).
+
+**ICP Context:**
+{icp_context}
+
+**Signals to Analyze ({signal_count} total):**
+{signals_text}
+
+**Your Task:**
+Analyze every signal independently and return a JSON array with exactly {signal_count} objects, one per signal, in the same order as the signals above. Set "index" to the signal's number from its "### Signal n" header. Be precise and evidence-based.
+
+**Required JSON Output (for each array element):**
+{{
+  "index": <signal number>,
+  "icp_match": <boolean>,
+  "size_bucket": "<1|2-5|6-10|11-20|unknown>",
+  "region": "<india|other|unknown>",
+  "role_type": "<first_marketer|agency_replacement|extra_headcount|unclear>",
+  "pain_tags": ["<array of pain indicators>"],
+  "score_fit": <0-50, ICP fitness score>,
+  "score_pain": <0-40, pain intensity score>,
+  "score_data_quality": <0-10, signal quality score>,
+  "situation": "<SPIN: current situation>",
+  "problem": "<SPIN: problem identified>",
+  "implication": "<SPIN: implications of problem>",
+  "need_payoff": "<SPIN: potential payoff>",
+  "economic_buyer_guess": "<founder|ceo|gm|other>",
+  "key_pain": "<40 words max>",
+  "chaos_flags": ["<array of chaos indicators>"],
+  "silver_bullet_phrases": ["<array of compelling phrases>"]
+}}
+
+**Scoring Guidelines:**
+- score_fit (0-50): How well does this match the ICP? Consider company size, industry, region.
+- score_pain (0-40): How intense is the marketing pain? Look for urgency, frustration, budget mentions.
+- score_data_quality (0-10): How complete and reliable is the signal data?
+
+Return ONLY the JSON array, no additional text."""
+
         # Dossier template (4B model)
         self.templates["dossier"] = """You are a strategic sales analyst. You've been given a high-scoring lead signal that needs a detailed dossier for the sales team.
 
@@ -174,7 +214,7 @@ Return a concise summary (2-3 sentences) that captures the key information for s
 
         # Fallback to defaults for missing templates
         default_manager = PromptTemplateManager(enable_custom=False)
-        for template_name in ["classification", "dossier", "icp_embedding", "signal_embedding"]:
+        for template_name in ["classification", "classification_batch", "dossier", "icp_embedding", "signal_embedding"]:
             if template_name not in self.templates:
                 logger.warning(f"Template '{template_name}' not found in custom templates. Using default.")
                 self.templates[template_name] = default_manager.templates[template_name]
@@ -185,7 +225,10 @@ Return a concise summary (2-3 sentences) that captures the key information for s
 
         # Save each template as a separate YAML file
         templates_to_save = {
-            "classification.yaml": {"classification": self.templates["classification"]},
+            "classification.yaml": {
+                "classification": self.templates["classification"],
+                "classification_batch": self.templates["classification_batch"]
+            },
             "dossier.yaml": {"dossier": self.templates["dossier"]},
             "embeddings.yaml": {
                 "icp_embedding": self.templates["icp_embedding"],
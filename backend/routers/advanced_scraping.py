@@ -4,9 +4,12 @@ from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
 
-from database import SessionLocal
+from database import get_db
+from config import get_settings
+from cache_manager import get_cache_manager
 from depth_crawler import DepthLimitedCrawler, summarize_crawled_text
 from social_media_scraper import (
     LinkedInPublicScraper,
@@ -22,14 +25,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ============================================================================
 # Depth-Limited Website Crawler
 # ============================================================================
@@ -60,13 +55,23 @@ async def crawl_website(
         auto_classify: If True, classify the crawled content as a signal
     """
     try:
-        crawler = DepthLimitedCrawler(
-            max_pages=input_data.max_pages,
-            max_depth=input_data.max_depth,
-        )
+        # Site content changes over days, so a repeat crawl with the same limits
+        # within CRAWL_CACHE_TTL_SECONDS is served from the cache (memory or Redis)
+        settings = get_settings()
+        cache = get_cache_manager() if settings.crawl_cache_ttl_seconds > 0 else None
+        crawl_key = f"{input_data.url.rstrip('/')}|{input_data.max_pages}|{input_data.max_depth}"
+        crawled_data = await cache.get(crawl_key, model="crawl") if cache else None
+
+        if crawled_data is None:
+            crawler = DepthLimitedCrawler(
+                max_pages=input_data.max_pages,
+                max_depth=input_data.max_depth,
+            )
 
-        # Crawl the website
-        crawled_data = crawler.crawl(input_data.url)
+            # Crawl the website (blocking fetches + rate-limit sleeps, so off the event loop)
+            crawled_data = await asyncio.to_thread(crawler.crawl, input_data.url)
+            if cache and crawled_data['pages_crawled']:
+                await cache.set(crawl_key, crawled_data, model="crawl", ttl=settings.crawl_cache_ttl_seconds)
 
         if crawled_data['pages_crawled'] == 0:
             raise HTTPException(status_code=400, detail="Failed to crawl any pages from the website")
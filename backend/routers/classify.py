@@ -1,28 +1,28 @@
 """Enhanced classification logic with concurrent processing, caching, and embeddings."""
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import event, func, insert, literal, or_, select, true, union, update
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Pattern, Set, Tuple
 import asyncio
-import json
+import orjson
+import re
+import threading
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
 import logging
-from database import Lead, Company, Contact, Signal, ICPProfile, SessionLocal
+from database import Lead, Company, Contact, Signal, ICPProfile, SessionLocal, company_insert, get_db
 from pydantic import BaseModel
-from datetime import datetime
-from config import Settings
-from ollama_wrapper import get_ollama_manager
+from config import get_settings
+from ollama_wrapper import get_ollama_manager, icp_cache_key
 from cache_manager import get_cache_manager
 from prompt_templates import get_prompt_manager
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 class SignalInput(BaseModel):
     signal_text: str
@@ -39,44 +39,394 @@ class ClassificationResult(BaseModel):
     company_id: Optional[int]
     lead_id: Optional[int]
 
+# Score buckets and the (inclusive) lower bound of every bucket above "parked"
+SCORE_BUCKETS = ("parked", "nurture", "warm", "red_hot")
+SCORE_BUCKET_BOUNDARIES = (40, 60, 80)
+
 def compute_score_bucket(total_score: float) -> str:
     """Convert score to bucket."""
-    if total_score >= 80:
-        return "red_hot"
-    elif total_score >= 60:
-        return "warm"
-    elif total_score >= 40:
-        return "nurture"
-    else:
-        return "parked"
+    return SCORE_BUCKETS[bisect_right(SCORE_BUCKET_BOUNDARIES, total_score)]
+
+def compute_total_score(classification: Dict[str, Any]) -> float:
+    """Sum the fit, pain and data-quality scores of a classification."""
+    return (
+        classification.get("score_fit", 0) +
+        classification.get("score_pain", 0) +
+        classification.get("score_data_quality", 0)
+    )
+
+# (version token, icp_context, icp_key) of the last aggregation; see build_icp_context
+_icp_context_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any], Optional[str]]] = None
+_icp_context_lock = threading.Lock()
+_icp_context_checked_at = 0.0  # time.monotonic() of the last version check
+_icp_context_dirty = True
+
+def _mark_icp_context_dirty(*_):
+    """Force the next build_icp_context call to re-check the ICP table."""
+    global _icp_context_dirty
+    _icp_context_dirty = True
+
+for _icp_event in ("after_insert", "after_update", "after_delete"):
+    event.listen(ICPProfile, _icp_event, _mark_icp_context_dirty)
+
+# Per dialect: (table-valued function expanding a JSON array into one row per
+# element, function returning a JSON value's type name)
+_JSON_ARRAY_FUNCTIONS = {
+    "sqlite": (func.json_each, func.json_type),
+    "postgresql": (func.json_array_elements_text, func.json_typeof),
+}
+_ICP_KEYWORD_COLUMNS = ("industries", "pain_keywords", "hiring_keywords")
+
+def collect_icp_keywords(db: Session) -> Dict[str, set]:
+    """
+    Distinct keywords per ICP keyword column, across all profiles.
+
+    On SQLite and Postgres the arrays are expanded and de-duplicated in the
+    database with a single UNION query; elsewhere the columns are read and
+    merged in one Python pass.
+    """
+    keywords: Dict[str, set] = {column: set() for column in _ICP_KEYWORD_COLUMNS}
+    json_functions = _JSON_ARRAY_FUNCTIONS.get(db.get_bind().dialect.name)
+
+    if json_functions is not None:
+        array_elements, json_type = json_functions
+        selects = []
+        for column in _ICP_KEYWORD_COLUMNS:
+            values = getattr(ICPProfile, column)
+            elements = array_elements(values).table_valued("value")
+            selects.append(
+                select(literal(column).label("kind"), elements.c.value)
+                .select_from(ICPProfile)
+                .join(elements, true())
+                .where(json_type(values) == "array")  # skip JSON null columns
+            )
+        for kind, value in db.execute(union(*selects)):
+            keywords[kind].add(value)
+        return keywords
+
+    rows = db.query(*(getattr(ICPProfile, column) for column in _ICP_KEYWORD_COLUMNS))
+    for row in rows:
+        for column, values in zip(_ICP_KEYWORD_COLUMNS, row):
+            keywords[column].update(values or ())
+    return keywords
+
+def build_icp_context(db: Session) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Aggregate all ICP profiles into the context passed to the classifier.
+
+    Returns the context and its canonical cache key (icp_cache_key), both
+    cached and only rebuilt when the ICP table changes, detected via a cheap
+    (count, max(updated_at)) token so it stays valid across workers. That
+    token is only queried when an ICP was written in this process or every
+    ICP_CONTEXT_TTL_SECONDS (for writes from other workers); otherwise no
+    query is made. Keyword lists are sorted so the context is stable between
+    processes. Callers must treat the returned dict as read-only.
+    """
+    global _icp_context_cache, _icp_context_checked_at, _icp_context_dirty
+
+    with _icp_context_lock:
+        now = time.monotonic()
+        if (
+            _icp_context_cache is not None
+            and not _icp_context_dirty
+            and now - _icp_context_checked_at < get_settings().icp_context_ttl_seconds
+        ):
+            return _icp_context_cache[1], _icp_context_cache[2]
+
+        _icp_context_dirty = False
+        _icp_context_checked_at = now
+        version = tuple(db.query(func.count(ICPProfile.id), func.max(ICPProfile.updated_at)).one())
+        if _icp_context_cache is not None and _icp_context_cache[0] == version:
+            return _icp_context_cache[1], _icp_context_cache[2]
+
+        keywords = collect_icp_keywords(db)
+        icp_context = {
+            "size_buckets": ["1", "2-5", "6-10", "11-20"],
+            "industries": sorted(keywords["industries"]),
+            "pain_keywords": sorted(keywords["pain_keywords"]),
+            "hiring_keywords": sorted(keywords["hiring_keywords"]),
+        }
+        icp_key = icp_cache_key(icp_context)
+        _icp_context_cache = (version, icp_context, icp_key)
+        return icp_context, icp_key
+
+def load_icp_context() -> Tuple[Dict[str, Any], Optional[str]]:
+    """build_icp_context on a short-lived session of its own (blocking; run off the event loop)."""
+    db = SessionLocal()
+    try:
+        return build_icp_context(db)
+    finally:
+        db.close()
+
+@lru_cache(maxsize=16)
+def compile_keyword_prefilter(keywords: Tuple[str, ...]) -> Optional[Pattern]:
+    """
+    Compile ICP keywords into one case-insensitive alternation.
+
+    Returns None when there are no keywords, in which case nothing should be
+    prefiltered. Cached per keyword tuple, i.e. per ICP version.
+    """
+    keywords = tuple(kw for kw in keywords if kw)
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+def get_or_create_company(db: Session, signal: SignalInput) -> Optional[int]:
+    """Return the id of the signal's company, creating it if needed."""
+    if not signal.company_name:
+        return None
+
+    match = func.lower(Company.name) == signal.company_name.lower()
+    if signal.company_website:
+        match = or_(match, Company.website == signal.company_website)
+    lookup = select(Company.id).where(match).limit(1)
+
+    company_id = db.execute(lookup).scalar()
+    if company_id is not None:
+        return company_id
+
+    # A concurrent request may create the same company between the lookup and
+    # the insert; the conflict is skipped and the winner's row is read instead
+    company_id = db.execute(
+        company_insert(db).values(
+            name=signal.company_name,
+            website=signal.company_website,
+            country="india",
+        ).returning(Company.id)
+    ).scalar()
+    if company_id is None:
+        company_id = db.execute(lookup).scalar()
+    db.commit()
+    return company_id
+
+def resolve_company_ids(db: Session, signals: List[SignalInput]) -> List[Optional[int]]:
+    """
+    Get-or-create the companies for a batch of signals.
+
+    Existing company ids are fetched with one column-only query on
+    lower(name) / website; missing ones are created (once per distinct name)
+    with a single multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING, and
+    any row lost to a concurrent insert is re-read. Nothing is committed.
+    Returns company ids aligned with `signals`.
+    """
+    names = {s.company_name.lower() for s in signals if s.company_name}
+    websites = {s.company_website for s in signals if s.company_name and s.company_website}
+
+    ids_by_name: Dict[str, int] = {}
+    ids_by_website: Dict[str, int] = {}
+
+    def fetch_existing(names: Set[str], websites: Set[str]) -> None:
+        existing = db.execute(
+            select(Company.id, Company.name, Company.website).where(
+                or_(func.lower(Company.name).in_(names), Company.website.in_(websites))
+            )
+        )
+        for company_id, name, website in existing:
+            if name:
+                ids_by_name.setdefault(name.lower(), company_id)
+            if website:
+                ids_by_website.setdefault(website, company_id)
+
+    if names:
+        fetch_existing(names, websites)
+
+    # Companies to create, keyed by lower(name); a website already claimed by a
+    # pending row also counts as a match, as it would for an existing company
+    new_rows: Dict[str, Dict[str, Any]] = {}
+    pending_websites = set()
+    for signal in signals:
+        if not signal.company_name:
+            continue
+        key = signal.company_name.lower()
+        website = signal.company_website
+        if key in ids_by_name or key in new_rows or website in ids_by_website or website in pending_websites:
+            continue
+        new_rows[key] = {"name": signal.company_name, "website": website, "country": "india"}
+        if website:
+            pending_websites.add(website)
+
+    if new_rows:
+        created = db.execute(
+            company_insert(db).returning(Company.id, Company.name, Company.website),
+            list(new_rows.values()),
+        )
+        for company_id, name, website in created:
+            ids_by_name[name.lower()] = company_id
+            if website:
+                ids_by_website.setdefault(website, company_id)
+
+        # Rows skipped on conflict were created concurrently by another request
+        lost = [row for key, row in new_rows.items() if key not in ids_by_name]
+        if lost:
+            fetch_existing(
+                {row["name"].lower() for row in lost},
+                {row["website"] for row in lost if row["website"]},
+            )
+
+    return [
+        (ids_by_name.get(s.company_name.lower()) or ids_by_website.get(s.company_website))
+        if s.company_name else None
+        for s in signals
+    ]
+
+def signal_values(company_id: Optional[int], signal: SignalInput) -> Dict[str, Any]:
+    """Column values for the raw Signal row of a classified input."""
+    return {
+        "company_id": company_id,
+        "source_type": signal.source_type,
+        "source_url": signal.source_url,
+        "raw_text": signal.signal_text,
+    }
+
+def lead_values(
+    company_id: Optional[int],
+    classification: Dict[str, Any],
+    total_score: float,
+    score_bucket: str,
+) -> Dict[str, Any]:
+    """Column values for a new Lead row from a 1B classification."""
+    return {
+        "company_id": company_id,
+        "score_icp_fit": classification.get("score_fit", 0),
+        "score_marketing_pain": classification.get("score_pain", 0),
+        "score_data_quality": classification.get("score_data_quality", 0),
+        "total_score": total_score,
+        "score_bucket": score_bucket,
+        "role_type": classification.get("role_type", "unclear"),
+        "pain_tags": classification.get("pain_tags", []),
+        "situation": classification.get("situation", ""),
+        "problem": classification.get("problem", ""),
+        "implication": classification.get("implication", ""),
+        "need_payoff": classification.get("need_payoff", ""),
+        "economic_buyer_guess": classification.get("economic_buyer_guess", ""),
+        "key_pain": classification.get("key_pain", ""),
+        "chaos_flags": classification.get("chaos_flags", []),
+        "silver_bullet_phrases": classification.get("silver_bullet_phrases", []),
+        "status": "new",
+    }
+
+def save_signal_and_lead(
+    db: Session,
+    signal: SignalInput,
+    company_id: Optional[int],
+    classification: Dict[str, Any],
+    total_score: float,
+    score_bucket: str,
+) -> int:
+    """
+    Persist the raw signal and its lead in one transaction and return the lead id
+    (blocking; run off the event loop).
+    """
+    db_lead = Lead(**lead_values(company_id, classification, total_score, score_bucket))
+    db.add_all([Signal(**signal_values(company_id, signal)), db_lead])
+    db.flush()
+    lead_id = db_lead.id
+    db.commit()
+    return lead_id
+
+def save_batch_signals_and_leads(
+    db: Session,
+    items: List[Tuple[SignalInput, Dict[str, Any], float, str]],
+) -> List[int]:
+    """
+    Persist signals and leads for a batch of (signal, classification,
+    total_score, score_bucket) with one multi-row INSERT per table and a
+    single commit.
+
+    Returns the new lead ids in input order.
+    """
+    company_ids = resolve_company_ids(db, [item[0] for item in items])
+
+    signal_rows = []
+    lead_rows = []
+    for (signal, classification, total_score, score_bucket), company_id in zip(items, company_ids):
+        signal_rows.append(signal_values(company_id, signal))
+        lead_rows.append(lead_values(company_id, classification, total_score, score_bucket))
+
+    db.execute(insert(Signal), signal_rows)
+    lead_ids = db.scalars(
+        insert(Lead).returning(Lead.id, sort_by_parameter_order=True),
+        lead_rows,
+    ).all()
+    db.commit()
+    return list(lead_ids)
+
+def save_dossier(lead_id: int, dossier: Dict[str, Any]) -> bool:
+    """Write a generated dossier onto its lead using a dedicated session."""
+    db = SessionLocal()
+    try:
+        # Single UPDATE; the lead row itself is never loaded
+        result = db.execute(
+            update(Lead).where(Lead.id == lead_id).values(
+                context_dossier=dossier.get("snapshot", "") + "\n\n" +
+                                "\n".join(dossier.get("why_pain_bullets", [])),
+                challenger_insight=dossier.get("challenger_insight", ""),
+                reframe_suggestion=dossier.get("reframe_suggestion", ""),
+            )
+        )
+        db.commit()
+        return result.rowcount > 0
+    finally:
+        db.close()
+
+# Dossier tasks started without a request's BackgroundTasks (scheduler,
+# direct calls); kept referenced so they are not garbage-collected mid-run
+_dossier_tasks: Set[asyncio.Task] = set()
+# Caps concurrent 4B dossier calls so they don't starve 1B classification
+_dossier_semaphore: Optional[asyncio.Semaphore] = None
 
 async def generate_dossier_async(
     lead_id: int,
     lead_json: Dict[str, Any],
-    signal_snippets: list,
-    db: Session,
+    signal_text: str,
+    max_len: int,
 ):
-    """Background task to generate 4B dossier for high-scoring leads."""
+    """
+    Background task to generate 4B dossier for high-scoring leads.
+
+    Runs after the response is sent, when the request-scoped session has
+    already been closed, so it opens its own session to save the result.
+    """
+    global _dossier_semaphore
+    if _dossier_semaphore is None:
+        _dossier_semaphore = asyncio.Semaphore(get_settings().dossier_concurrency_limit)
+
     try:
         ollama = get_ollama_manager()
         if not ollama:
             logger.error("OllamaManager not initialized")
             return
 
-        dossier = await ollama.generate_dossier(lead_json, signal_snippets)
-
-        lead = db.query(Lead).filter(Lead.id == lead_id).first()
-        if lead:
-            lead.context_dossier = dossier.get("snapshot", "") + "\n\n" + \
-                                  "\n".join(dossier.get("why_pain_bullets", []))
-            lead.challenger_insight = dossier.get("challenger_insight", "")
-            lead.reframe_suggestion = dossier.get("reframe_suggestion", "")
-            lead.updated_at = datetime.utcnow()
-            db.add(lead)
-            db.commit()
-            logger.info(f"✅ Dossier generated for lead {lead_id}")
+        # Truncate here, only once the dossier is actually being generated
+        signal_snippets = [signal_text[:max_len]]
+        async with _dossier_semaphore:
+            dossier = await ollama.generate_dossier(lead_json, signal_snippets)
+
+        if await asyncio.to_thread(save_dossier, lead_id, dossier):
+            logger.info("✅ Dossier generated for lead %s", lead_id)
     except Exception as e:
-        logger.error(f"Error generating dossier for lead {lead_id}: {e}")
+        logger.error("Error generating dossier for lead %s: %s", lead_id, e)
+
+def queue_dossier(
+    background_tasks: Optional[BackgroundTasks],
+    lead_id: int,
+    lead_json: Dict[str, Any],
+    signal_text: str,
+    max_len: int = 500,
+):
+    """
+    Schedule dossier generation for a lead.
+
+    Uses the request's BackgroundTasks when there is one; callers outside a
+    request pass None and get a fire-and-forget task on the running loop.
+    """
+    if background_tasks is not None:
+        background_tasks.add_task(generate_dossier_async, lead_id, lead_json, signal_text, max_len)
+        return
+
+    task = asyncio.create_task(generate_dossier_async(lead_id, lead_json, signal_text, max_len))
+    _dossier_tasks.add(task)
+    task.add_done_callback(_dossier_tasks.discard)
 
 @router.post("/signal", response_model=ClassificationResult)
 async def classify_signal(
@@ -91,90 +441,41 @@ async def classify_signal(
     3. Return lead with scores and classification
     """
     try:
-        # Get list of ICPs to pass context
-        icps = db.query(ICPProfile).all()
-        icp_context = {
-            "size_buckets": ["1", "2-5", "6-10", "11-20"],
-            "industries": list(set([ind for icp in icps for ind in icp.industries])),
-            "pain_keywords": list(set([kw for icp in icps for kw in icp.pain_keywords])),
-            "hiring_keywords": list(set([kw for icp in icps for kw in icp.hiring_keywords])),
-        }
-
         # Get singleton Ollama manager
         ollama = get_ollama_manager()
         if not ollama:
             raise HTTPException(status_code=500, detail="OllamaManager not initialized")
 
-        # 1B classification (with caching)
-        classification = await ollama.classify_signal(signal.signal_text, icp_context, use_cache=True)
+        async def classify() -> Dict[str, Any]:
+            # ICP context on its own session, since the company lookup uses db meanwhile
+            icp_context, icp_key = await asyncio.to_thread(load_icp_context)
+            return await ollama.classify_signal(signal.signal_text, icp_context, use_cache=True, icp_key=icp_key)
+
+        # ICP context + 1B classification (with caching) overlapped with the
+        # company lookup, which depends on neither. Both are awaited to the end
+        # so a failure never rolls back db while the lookup is still using it.
+        classification, company_id = await asyncio.gather(
+            classify(),
+            asyncio.to_thread(get_or_create_company, db, signal),
+            return_exceptions=True,
+        )
+        for outcome in (classification, company_id):
+            if isinstance(outcome, BaseException):
+                raise outcome
 
         # Compute total score
-        total_score = (
-            classification.get("score_fit", 0) +
-            classification.get("score_pain", 0) +
-            classification.get("score_data_quality", 0)
-        )
+        total_score = compute_total_score(classification)
         score_bucket = compute_score_bucket(total_score)
 
-        # Get or create company
-        company_id = None
-        if signal.company_name:
-            company = db.query(Company).filter(
-                (Company.name.ilike(signal.company_name)) |
-                (Company.website == signal.company_website)
-            ).first()
-
-            if not company:
-                company = Company(
-                    name=signal.company_name,
-                    website=signal.company_website,
-                    country="india",
-                )
-                db.add(company)
-                db.commit()
-                db.refresh(company)
-
-            company_id = company.id
-
-        # Create signal record
-        db_signal = Signal(
-            company_id=company_id,
-            source_type=signal.source_type,
-            source_url=signal.source_url,
-            raw_text=signal.signal_text,
-        )
-        db.add(db_signal)
-        db.commit()
-        db.refresh(db_signal)
-
-        # Create lead
-        db_lead = Lead(
-            company_id=company_id,
-            score_icp_fit=classification.get("score_fit", 0),
-            score_marketing_pain=classification.get("score_pain", 0),
-            score_data_quality=classification.get("score_data_quality", 0),
-            total_score=total_score,
-            score_bucket=score_bucket,
-            role_type=classification.get("role_type", "unclear"),
-            pain_tags=classification.get("pain_tags", []),
-            situation=classification.get("situation", ""),
-            problem=classification.get("problem", ""),
-            implication=classification.get("implication", ""),
-            need_payoff=classification.get("need_payoff", ""),
-            economic_buyer_guess=classification.get("economic_buyer_guess", ""),
-            key_pain=classification.get("key_pain", ""),
-            chaos_flags=classification.get("chaos_flags", []),
-            silver_bullet_phrases=classification.get("silver_bullet_phrases", []),
-            status="new",
+        # Create signal and lead records without blocking the event loop
+        lead_id = await asyncio.to_thread(
+            save_signal_and_lead, db, signal, company_id, classification, total_score, score_bucket
         )
-        db.add(db_lead)
-        db.commit()
-        db.refresh(db_lead)
 
-        logger.info(f"✅ Lead {db_lead.id} created with score {total_score}")
+        logger.info("✅ Lead %s created with score %s", lead_id, total_score)
 
         # If score > threshold, queue dossier generation
-        settings = Settings()
+        settings = get_settings()
         if total_score > settings.classifier_score_threshold:
             lead_json = {
                 "role_type": classification.get("role_type"),
@@ -183,17 +484,9 @@ async def classify_signal(
                 "situation": classification.get("situation", ""),
                 "problem": classification.get("problem", ""),
             }
-            signal_snippets = [signal.signal_text[:500]]  # Truncate for dossier
-
-            # Queue background task
-            background_tasks.add_task(
-                generate_dossier_async,
-                db_lead.id,
-                lead_json,
-                signal_snippets,
-                db,
-            )
-            logger.info(f"🔄 Queued dossier generation for lead {db_lead.id}")
+            # Queue background task (snippet is truncated by the consumer)
+            queue_dossier(background_tasks, lead_id, lead_json, signal.signal_text)
+            logger.info("🔄 Queued dossier generation for lead %s", lead_id)
 
         return ClassificationResult(
             icp_match=classification.get("icp_match", False),
@@ -201,185 +494,231 @@ async def classify_signal(
             score_bucket=score_bucket,
             classification=classification,
             company_id=company_id,
-            lead_id=db_lead.id,
+            lead_id=lead_id,
         )
 
     except Exception as e:
-        logger.error(f"Error in classify_signal: {e}")
+        logger.error("Error in classify_signal: %s", e)
+        # Ingest and scheduled callers reuse this session for the next signal
+        await asyncio.to_thread(db.rollback)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/signal/batch")
 async def classify_signals_batch(
     signals: List[SignalInput],
+    stream: bool = False,
     db: Session = Depends(get_db),
 ):
     """
     Classify multiple signals in parallel using asyncio.gather.
 
+    With ``?stream=true`` the response is NDJSON: one line per signal (tagged
+    with its ``index`` in the request) as soon as its chunk is classified and
+    saved, followed by a final ``{"summary": {...}}`` line.
+
     Features:
+    - Several signals per 1B prompt (BATCH_PROMPT_SIZE), sharing the ICP prefix
     - Concurrent processing with configurable concurrency limit
-    - Multi-stage filtering (prefilter with score threshold)
-    - Caching for repeated signals
+    - Multi-stage filtering (ICP keyword prefilter before the LLM, then score threshold)
+    - Caching for repeated signals; identical texts in one request are classified once
     - Batch creation of leads
+    - Requests over MAX_BATCH_SIZE signals are rejected with 413
     """
-    settings = Settings()
+    settings = get_settings()
+    if len(signals) > settings.max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(signals)} signals exceeds MAX_BATCH_SIZE={settings.max_batch_size}"
+        )
+
     ollama = get_ollama_manager()
     if not ollama:
         raise HTTPException(status_code=500, detail="OllamaManager not initialized")
 
     # Get ICP context once
-    icps = db.query(ICPProfile).all()
-    icp_context = {
-        "size_buckets": ["1", "2-5", "6-10", "11-20"],
-        "industries": list(set([ind for icp in icps for ind in icp.industries])),
-        "pain_keywords": list(set([kw for icp in icps for kw in icp.pain_keywords])),
-        "hiring_keywords": list(set([kw for icp in icps for kw in icp.hiring_keywords])),
-    }
-
-    async def classify_single(signal: SignalInput) -> Dict[str, Any]:
-        """Classify a single signal with error handling."""
-        try:
-            classification = await ollama.classify_signal(
-                signal.signal_text,
-                icp_context,
-                use_cache=True
-            )
-
-            total_score = (
-                classification.get("score_fit", 0) +
-                classification.get("score_pain", 0) +
-                classification.get("score_data_quality", 0)
-            )
-
-            # Multi-stage filtering: skip low-scoring signals
-            if total_score < settings.prefilter_score_threshold:
-                logger.debug(f"Signal filtered out (score={total_score} < {settings.prefilter_score_threshold})")
-                return {
-                    "signal": signal.signal_text[:100],
+    icp_context, icp_key = await asyncio.to_thread(build_icp_context, db)
+
+    prefilter_threshold = settings.prefilter_score_threshold
+
+    def build_results(
+        indexes: List[int],
+        classification: Dict[str, Any],
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Score one classification and apply the prefilter threshold for every index sharing it."""
+        total_score = compute_total_score(classification)
+
+        # Multi-stage filtering: skip low-scoring signals
+        if total_score < prefilter_threshold:
+            logger.debug("Signal filtered out (score=%s < %s)", total_score, prefilter_threshold)
+            return [
+                (i, {
+                    "signal": signals[i].signal_text[:100],
                     "total_score": total_score,
                     "status": "filtered",
                     "classification": classification
-                }
+                })
+                for i in indexes
+            ]
 
-            return {
-                "signal": signal.signal_text[:100],
+        score_bucket = compute_score_bucket(total_score)
+        return [
+            (i, {
+                "signal": signals[i].signal_text[:100],
                 "total_score": total_score,
+                "score_bucket": score_bucket,
                 "status": "ok",
-                "classification": classification,
-                "signal_obj": signal
-            }
+                "classification": classification
+            })
+            for i in indexes
+        ]
 
+    async def classify_chunk(chunk: List[Tuple[int, SignalInput]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """Classify a chunk of (index, signal) with a single batched 1B prompt."""
+        try:
+            classifications = await ollama.classify_signals_batch(
+                [signal.signal_text for _, signal in chunk],
+                icp_context,
+                use_cache=True,
+                icp_key=icp_key
+            )
+            # Score each classification once and fan it out to the signal's
+            # duplicates in the request
+            return [
+                pair
+                for (index, _), classification in zip(chunk, classifications)
+                for pair in build_results([index] + duplicates.get(index, []), classification)
+            ]
         except Exception as e:
-            logger.error(f"Error classifying signal: {e}")
-            return {
-                "signal": signal.signal_text[:100],
-                "error": str(e),
-                "status": "error",
-            }
-
-    # Process signals concurrently with semaphore for rate limiting
-    if settings.batch_enable_parallel:
-        semaphore = asyncio.Semaphore(settings.batch_concurrency_limit)
-
-        async def classify_with_semaphore(signal: SignalInput):
-            async with semaphore:
-                return await classify_single(signal)
+            logger.error("Error classifying signal batch: %s", e)
+            return [
+                (i, {"signal": signals[i].signal_text[:100], "error": str(e), "status": "error"})
+                for index, _ in chunk
+                for i in [index] + duplicates.get(index, [])
+            ]
+
+    async def save_chunk(chunk_results: List[Tuple[int, Dict[str, Any]]]) -> List[int]:
+        """Create leads for a chunk's successful classifications in one transaction."""
+        ok_items = [(i, r) for i, r in chunk_results if r["status"] == "ok" and "classification" in r]
+        if not ok_items:
+            return []
+        ok_results = [r for _, r in ok_items]
 
-        logger.info(f"Processing {len(signals)} signals in parallel (concurrency={settings.batch_concurrency_limit})")
-        results = await asyncio.gather(*[classify_with_semaphore(s) for s in signals])
-    else:
-        logger.info(f"Processing {len(signals)} signals sequentially")
-        results = []
-        for signal in signals:
-            result = await classify_single(signal)
-            results.append(result)
-
-    # Create leads for successful classifications
-    created_leads = []
-    for result in results:
-        if result["status"] == "ok" and "classification" in result:
-            try:
-                classification = result["classification"]
-                signal_obj = result["signal_obj"]
-                total_score = result["total_score"]
-                score_bucket = compute_score_bucket(total_score)
-
-                # Get or create company
-                company_id = None
-                if signal_obj.company_name:
-                    company = db.query(Company).filter(
-                        (Company.name.ilike(signal_obj.company_name)) |
-                        (Company.website == signal_obj.company_website)
-                    ).first()
-
-                    if not company:
-                        company = Company(
-                            name=signal_obj.company_name,
-                            website=signal_obj.company_website,
-                            country="india",
-                        )
-                        db.add(company)
-                        db.commit()
-                        db.refresh(company)
-
-                    company_id = company.id
-
-                # Create signal record
-                db_signal = Signal(
-                    company_id=company_id,
-                    source_type=signal_obj.source_type,
-                    source_url=signal_obj.source_url,
-                    raw_text=signal_obj.signal_text,
-                )
-                db.add(db_signal)
-                db.commit()
-                db.refresh(db_signal)
-
-                # Create lead
-                db_lead = Lead(
-                    company_id=company_id,
-                    score_icp_fit=classification.get("score_fit", 0),
-                    score_marketing_pain=classification.get("score_pain", 0),
-                    score_data_quality=classification.get("score_data_quality", 0),
-                    total_score=total_score,
-                    score_bucket=score_bucket,
-                    role_type=classification.get("role_type", "unclear"),
-                    pain_tags=classification.get("pain_tags", []),
-                    situation=classification.get("situation", ""),
-                    problem=classification.get("problem", ""),
-                    implication=classification.get("implication", ""),
-                    need_payoff=classification.get("need_payoff", ""),
-                    economic_buyer_guess=classification.get("economic_buyer_guess", ""),
-                    key_pain=classification.get("key_pain", ""),
-                    chaos_flags=classification.get("chaos_flags", []),
-                    silver_bullet_phrases=classification.get("silver_bullet_phrases", []),
-                    status="new",
-                )
-                db.add(db_lead)
-                db.commit()
-                db.refresh(db_lead)
-
-                created_leads.append(db_lead.id)
-                result["lead_id"] = db_lead.id
-
-                logger.info(f"✅ Lead {db_lead.id} created (batch) with score {total_score}")
-
-            except Exception as e:
-                logger.error(f"Error creating lead from batch result: {e}")
+        try:
+            lead_ids = await asyncio.to_thread(
+                save_batch_signals_and_leads,
+                db,
+                [(signals[i], r["classification"], r["total_score"], r["score_bucket"]) for i, r in ok_items],
+            )
+        except Exception as e:
+            await asyncio.to_thread(db.rollback)
+            logger.error("Error creating leads from batch results: %s", e)
+            for result in ok_results:
                 result["status"] = "error"
                 result["error"] = str(e)
+            return []
+
+        for result, lead_id in zip(ok_results, lead_ids):
+            result["lead_id"] = lead_id
+        logger.info("✅ Created %s leads (batch)", len(lead_ids))
+        return lead_ids
+
+    # Keyword prefilter: signals mentioning none of the ICP pain/hiring keywords
+    # are filtered without spending an LLM call on them
+    keyword_pattern = None
+    if settings.enable_keyword_prefilter:
+        keyword_pattern = compile_keyword_prefilter(
+            tuple(icp_context["pain_keywords"] + icp_context["hiring_keywords"])
+        )
 
-    # Clean up results (remove signal_obj which is not JSON serializable)
-    for result in results:
-        result.pop("signal_obj", None)
-
-    return {
-        "count": len(results),
-        "created_leads": len(created_leads),
-        "filtered": sum(1 for r in results if r.get("status") == "filtered"),
-        "errors": sum(1 for r in results if r.get("status") == "error"),
-        "results": results
-    }
+    keyword_filtered: List[Tuple[int, Dict[str, Any]]] = []
+    candidates = []
+    # Identical signal texts are classified once: first index -> later indexes
+    first_index_by_text: Dict[str, int] = {}
+    duplicates: Dict[int, List[int]] = {}
+    for index, signal in enumerate(signals):
+        if keyword_pattern is not None and not keyword_pattern.search(signal.signal_text):
+            keyword_filtered.append((index, {
+                "signal": signal.signal_text[:100],
+                "total_score": 0,
+                "status": "filtered",
+                "reason": "no ICP keyword match",
+            }))
+        elif signal.signal_text in first_index_by_text:
+            duplicates.setdefault(first_index_by_text[signal.signal_text], []).append(index)
+        else:
+            first_index_by_text[signal.signal_text] = index
+            candidates.append((index, signal))
+
+    # Group signals so each 1B request classifies several of them at once
+    chunk_size = max(1, settings.batch_prompt_size)
+    chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+    summary = {"count": len(signals), "created_leads": 0, "filtered": 0, "errors": 0}
+
+    async def completed_chunks():
+        """Yield (index, result) pairs chunk by chunk, in completion order."""
+        yield keyword_filtered
+
+        # Process chunks concurrently, keeping at most BATCH_CONCURRENCY_LIMIT in flight
+        if settings.batch_enable_parallel:
+            logger.info(
+                "Processing %s signals in %s prompts in parallel (concurrency=%s, keyword-filtered=%s, duplicates=%s)",
+                len(signals), len(chunks), settings.batch_concurrency_limit, len(keyword_filtered),
+                len(signals) - len(keyword_filtered) - len(candidates),
+            )
+            # Tasks are started as earlier ones finish rather than all up front, so
+            # pending work stays O(concurrency); a disconnected stream cancels the rest
+            remaining = iter(chunks)
+            in_flight: Set[asyncio.Task] = {
+                asyncio.ensure_future(classify_chunk(chunk))
+                for chunk in islice(remaining, max(1, settings.batch_concurrency_limit))
+            }
+            try:
+                while in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    # Refill before saving so the model keeps working meanwhile
+                    for chunk in islice(remaining, len(done)):
+                        in_flight.add(asyncio.ensure_future(classify_chunk(chunk)))
+                    for task in done:
+                        chunk_results = task.result()
+                        summary["created_leads"] += len(await save_chunk(chunk_results))
+                        yield chunk_results
+            finally:
+                for task in in_flight:
+                    task.cancel()
+        else:
+            logger.info(
+                "Processing %s signals in %s prompts sequentially (keyword-filtered=%s, duplicates=%s)",
+                len(signals), len(chunks), len(keyword_filtered),
+                len(signals) - len(keyword_filtered) - len(candidates),
+            )
+            for chunk in chunks:
+                chunk_results = await classify_chunk(chunk)
+                summary["created_leads"] += len(await save_chunk(chunk_results))
+                yield chunk_results
+
+    async def finished_results():
+        """Yield (index, result) pairs while keeping the summary counts."""
+        async for chunk_results in completed_chunks():
+            for index, result in chunk_results:
+                if result.get("status") == "filtered":
+                    summary["filtered"] += 1
+                elif result.get("status") == "error":
+                    summary["errors"] += 1
+                yield index, result
+
+    if stream:
+        async def ndjson_lines():
+            async for index, result in finished_results():
+                yield orjson.dumps({"index": index, **result}) + b"\n"
+            yield orjson.dumps({"summary": summary}) + b"\n"
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(signals)
+    async for index, result in finished_results():
+        results[index] = result
+
+    return {**summary, "results": results}
 
 
 @router.get("/metrics")
@@ -1,21 +1,15 @@
 """ICP Whiteboard - define and manage Ideal Customer Profiles."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
-from database import ICPProfile, SessionLocal
-from pydantic import BaseModel
+from database import ICPProfile, get_db
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from datetime import datetime
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Pydantic schemas
 class ICPCreate(BaseModel):
     name: str
@@ -56,17 +50,15 @@ class ICPResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Built once; validating and dumping the list in one pass replaces FastAPI's
+# per-request response_model handling for list_icps
+_ICP_LIST_ADAPTER = TypeAdapter(List[ICPResponse])
 
 @router.post("/", response_model=ICPResponse)
 def create_icp(icp: ICPCreate, db: Session = Depends(get_db)):
     """Create a new ICP profile."""
-    # Check if name already exists
-    existing = db.query(ICPProfile).filter(ICPProfile.name == icp.name).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="ICP profile with this name already exists")
-
     db_icp = ICPProfile(
         name=icp.name,
         description=icp.description,
@@ -80,7 +72,12 @@ def create_icp(icp: ICPCreate, db: Session = Depends(get_db)):
         budget_signals=icp.budget_signals,
     )
     db.add(db_icp)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # name is UNIQUE, so the insert itself detects duplicates (no pre-check SELECT)
+        db.rollback()
+        raise HTTPException(status_code=400, detail="ICP profile with this name already exists")
     db.refresh(db_icp)
     return db_icp
 
@@ -88,7 +85,11 @@ def create_icp(icp: ICPCreate, db: Session = Depends(get_db)):
 def list_icps(db: Session = Depends(get_db)):
     """List all ICP profiles."""
     icps = db.query(ICPProfile).all()
-    return icps
+    # Returning a Response skips the response_model pass (kept for the OpenAPI schema)
+    return Response(
+        content=_ICP_LIST_ADAPTER.dump_json(_ICP_LIST_ADAPTER.validate_python(icps)),
+        media_type="application/json",
+    )
 
 @router.get("/{icp_id}", response_model=ICPResponse)
 def get_icp(icp_id: int, db: Session = Depends(get_db)):
@@ -106,11 +107,10 @@ def update_icp(icp_id: int, icp_update: ICPUpdate, db: Session = Depends(get_db)
         raise HTTPException(status_code=404, detail="ICP profile not found")
 
     # Update fields if provided
-    update_data = icp_update.dict(exclude_unset=True)
+    update_data = icp_update.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(icp, key, value)
 
-    icp.updated_at = datetime.utcnow()
     db.add(icp)
     db.commit()
     db.refresh(icp)
@@ -127,37 +127,39 @@ def delete_icp(icp_id: int, db: Session = Depends(get_db)):
     db.commit()
     return {"message": "ICP profile deleted"}
 
-# Sample ICP templates
+# Sample ICP templates (constant bodies, built once at import)
+_SOLO_FOUNDER_TEMPLATE = ICPCreate(
+    name="Solo Founder - Service Business",
+    description="Solo founder or 1-person team running a service business, looking to scale marketing",
+    size_buckets=["1"],
+    industries=["consulting", "freelance", "agency", "coaching"],
+    locations=["india"],
+    stages=["freelancer", "solo-founder"],
+    hiring_keywords=["marketing manager", "growth hacker", "performance marketer", "first marketing hire"],
+    pain_keywords=["lead generation", "scaling", "no marketing team", "need help marketing"],
+    channel_preferences=["linkedin", "instagram", "email"],
+    budget_signals=["diy", "first hire"],
+)
+
+_SMALL_D2C_TEMPLATE = ICPCreate(
+    name="Small D2C Brand",
+    description="Small D2C/eCommerce brand <10 people, running ads but no cohesive strategy",
+    size_buckets=["2-5", "6-10"],
+    industries=["ecommerce", "d2c", "saas", "consumer"],
+    locations=["india"],
+    stages=["early-startup", "small-agency"],
+    hiring_keywords=["marketing", "growth", "brand manager", "performance"],
+    pain_keywords=["roas", "cac", "retention", "brand building", "lead quality"],
+    channel_preferences=["instagram", "facebook", "google", "tiktok"],
+    budget_signals=["1-junior-marketer", "agency unhappy"],
+)
+
 @router.post("/templates/solo-founder")
 def create_solo_founder_icp(db: Session = Depends(get_db)):
     """Create a pre-built ICP for solo founders."""
-    icp = ICPCreate(
-        name="Solo Founder - Service Business",
-        description="Solo founder or 1-person team running a service business, looking to scale marketing",
-        size_buckets=["1"],
-        industries=["consulting", "freelance", "agency", "coaching"],
-        locations=["india"],
-        stages=["freelancer", "solo-founder"],
-        hiring_keywords=["marketing manager", "growth hacker", "performance marketer", "first marketing hire"],
-        pain_keywords=["lead generation", "scaling", "no marketing team", "need help marketing"],
-        channel_preferences=["linkedin", "instagram", "email"],
-        budget_signals=["diy", "first hire"],
-    )
-    return create_icp(icp, db)
+    return create_icp(_SOLO_FOUNDER_TEMPLATE, db)
 
 @router.post("/templates/small-d2c")
 def create_small_d2c_icp(db: Session = Depends(get_db)):
     """Create a pre-built ICP for small D2C brands."""
-    icp = ICPCreate(
-        name="Small D2C Brand",
-        description="Small D2C/eCommerce brand <10 people, running ads but no cohesive strategy",
-        size_buckets=["2-5", "6-10"],
-        industries=["ecommerce", "d2c", "saas", "consumer"],
-        locations=["india"],
-        stages=["early-startup", "small-agency"],
-        hiring_keywords=["marketing", "growth", "brand manager", "performance"],
-        pain_keywords=["roas", "cac", "retention", "brand building", "lead quality"],
-        channel_preferences=["instagram", "facebook", "google", "tiktok"],
-        budget_signals=["1-junior-marketer", "agency unhappy"],
-    )
-    return create_icp(icp, db)
+    return create_icp(_SMALL_D2C_TEMPLATE, db)
@@ -1,19 +1,28 @@
 """Data ingest - OCR, file uploads, contact extraction, RSS feeds, and more."""
 
-from fastapi import APIRouter, UploadFile, File, Depends, BackgroundTasks, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends, BackgroundTasks, HTTPException, Query
 from sqlalchemy.orm import Session
 import pytesseract
 from PIL import Image
-import io
+import asyncio
+import codecs
+import html
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 import re
 import logging
 import csv
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, BinaryIO, Iterable, Iterator, Tuple, Union
 from pydantic import BaseModel
 from datetime import datetime
-from database import SessionLocal
+from database import SessionLocal, get_db
+from config import get_settings
 from routers.classify import classify_signal as classify_signal_func
-from routers.classify import SignalInput
+from routers.classify import SignalInput, ClassificationResult
 
 try:
     from pypdf import PdfReader
@@ -25,6 +34,23 @@ try:
 except ImportError:
     pdfplumber = None
 
+try:
+    # Installed with pdfplumber; its C text extraction is much faster than pypdf's
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# pdfium is not thread-safe, and every call into it (extract_pdf_text, and
+# pdfplumber's page rendering in ocr_pdf) runs in worker threads
+_pdfium_lock = threading.Lock()
+
+try:
+    # Optional: keeps one Tesseract engine loaded across the pages of a scanned
+    # PDF instead of spawning a tesseract process per page
+    from tesserocr import OEM, PyTessBaseAPI
+except ImportError:
+    PyTessBaseAPI = None
+
 try:
     import phonenumbers
     from phonenumbers import NumberParseException
@@ -49,13 +75,6 @@ except ImportError:
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 class OCRResult(BaseModel):
     extracted_text: str
     detected_emails: list
@@ -63,10 +82,28 @@ class OCRResult(BaseModel):
     detected_names: list
     detected_company: Optional[str]
 
+# Contact-extraction patterns, compiled once instead of looked up per call
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Indian mobile (starts with 6-9), optionally prefixed with +91/91; one scan,
+# and the capture is the bare 10-digit number so prefixed and unprefixed
+# spellings of a number dedupe before they are parsed. Word boundaries keep it
+# out of longer digit runs (order ids, account numbers)
+_PHONE_RE = re.compile(r'\b(?:\+?91[-.\s]?)?([6-9]\d{9})\b')
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+_DIGIT_RE = re.compile(r'\d')
+# Repetition is capped so long title-cased runs (OCR noise, headings) stay cheap
+_NAME_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4}\b')
+# Name captures are capped at 100 chars so a failing search can't rescan
+# the rest of the text from every start position
+_COMPANY_RES = tuple(re.compile(p) for p in (
+    r'(?:Company|company|business|firm|organization)\s*:?\s*([A-Za-z0-9\s&.,]{1,100})',
+    r'at\s+([A-Za-z0-9\s&]{1,100}?)(?:\s+[,.]|$)',
+    r'([A-Za-z0-9\s&]{1,100}?)\s+(?:Pvt|Ltd|Inc|Corporation|Services)',
+))
+
 def extract_emails(text: str) -> list:
     """Extract email addresses from text using regex."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, text)
+    return _EMAIL_RE.findall(text)
 
 def normalize_phone_number(phone: str, default_region: str = "IN") -> Optional[str]:
     """
@@ -75,9 +112,17 @@ def normalize_phone_number(phone: str, default_region: str = "IN") -> Optional[s
     """
     if not phonenumbers:
         # Fallback: simple cleaning
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = _PHONE_CLEAN_RE.sub('', phone)
         return cleaned if len(cleaned) >= 10 else None
 
+    return _normalize_phone_cached(phone, default_region)
+
+@lru_cache(maxsize=4096)
+def _normalize_phone_cached(phone: str, default_region: str) -> Optional[str]:
+    """
+    phonenumbers parse + validate, cached: bulk ingests see the same numbers
+    (signatures, footers) over and over.
+    """
     try:
         # Parse the number
         parsed = phonenumbers.parse(phone, default_region)
@@ -92,21 +137,10 @@ def normalize_phone_number(phone: str, default_region: str = "IN") -> Optional[s
 
 def extract_phones(text: str) -> list:
     """Extract and normalize phone numbers from text using regex."""
-    phone_patterns = [
-        r'\+91[-.\s]?\d{10}',  # +91 followed by 10 digits
-        r'91[-.\s]?\d{10}',  # 91 followed by 10 digits
-        r'\b\d{10}\b',  # 10 consecutive digits
-        r'[6-9]\d{9}',  # Indian phone starting with 6-9
-    ]
-    phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        phones.extend(matches)
-
     # Normalize and deduplicate
     normalized = []
     seen = set()
-    for phone in phones:
+    for phone in dict.fromkeys(_PHONE_RE.findall(text)):
         norm = normalize_phone_number(phone)
         if norm and norm not in seen:
             normalized.append(norm)
@@ -117,27 +151,245 @@ def extract_phones(text: str) -> list:
 def extract_names(text: str) -> list:
     """Simple name extraction - look for capitalized word sequences."""
     # Very basic: find sequences of capitalized words
-    name_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'
-    return re.findall(name_pattern, text)[:5]  # Return max 5
+    # Return max 5, without matching the rest of the text
+    return [match.group() for match in islice(_NAME_RE.finditer(text), 5)]
 
 def extract_company(text: str) -> Optional[str]:
     """Try to extract company name from text."""
     # Look for common patterns: "Company:", "at X", "X Ltd", "X Pvt Ltd"
-    patterns = [
-        r'(?:Company|company|business|firm|organization)\s*:?\s*([A-Za-z0-9\s&.,]+)',
-        r'at\s+([A-Za-z0-9\s&]+?)(?:\s+[,.]|$)',
-        r'([A-Za-z0-9\s&]+?)\s+(?:Pvt|Ltd|Inc|Corporation|Services)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for company_re in _COMPANY_RES:
+        match = company_re.search(text)
         if match:
             return match.group(1).strip()
     return None
 
+# Tesseract page segmentation: 6 (one uniform block of text) suits business
+# cards and short forms and skips the layout analysis of the default (3)
+DEFAULT_OCR_PSM = 6
+
+def tesseract_config(psm: int) -> str:
+    """pytesseract config: LSTM engine only (no legacy pass) and the given PSM."""
+    return f'--oem 1 --psm {psm}'
+
+def to_grayscale(image: Image.Image) -> Image.Image:
+    """
+    Grayscale copy of an image for Tesseract, which binarizes a single channel
+    anyway; a third (or quarter) of the RGB(A) pixel data is handed over.
+    """
+    return image if image.mode in ("L", "1") else image.convert("L")
+
+def ocr_image(upload: BinaryIO, psm: int = DEFAULT_OCR_PSM) -> str:
+    """OCR an uploaded image with Tesseract (blocking; run off the event loop)."""
+    image = to_grayscale(Image.open(upload))
+    return pytesseract.image_to_string(image, lang='eng', config=tesseract_config(psm))
+
+def extract_pdf_text(upload: BinaryIO, filename: str) -> str:
+    """
+    Extract embedded text from a PDF with pdfium, or pypdf when pypdfium2
+    isn't installed (blocking; run off the event loop).
+    """
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(upload)
+            try:
+                pages_text = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if text:
+                        pages_text.append(text.replace("\r\n", "\n"))
+                page_count = len(pdf)
+            finally:
+                pdf.close()
+        logger.info(f"Extracted text from {page_count} pages of {filename}")
+        return "\n".join(pages_text)
+
+    reader = PdfReader(upload)
+    pages_text = []
+    for page in reader.pages:
+        text = page.extract_text()
+        if text:
+            pages_text.append(text)
+    logger.info(f"Extracted text from {len(reader.pages)} pages of {filename}")
+    return "\n".join(pages_text)
+
+@contextmanager
+def tesseract_session(psm: int = DEFAULT_OCR_PSM):
+    """
+    Yield an image -> text OCR function for a run of images (thread-safe).
+
+    With tesserocr each thread loads an engine (and its language data) on
+    first use and reuses it for every image; otherwise each image is a
+    pytesseract call.
+    """
+    if PyTessBaseAPI is None:
+        config = tesseract_config(psm)
+        yield lambda image: pytesseract.image_to_string(image, lang='eng', config=config)
+        return
+
+    local = threading.local()
+    apis = []
+
+    def ocr(image) -> str:
+        api = getattr(local, "api", None)
+        if api is None:
+            api = local.api = PyTessBaseAPI(lang='eng', psm=psm, oem=OEM.LSTM_ONLY)
+            apis.append(api)
+        api.SetImage(image)
+        return api.GetUTF8Text()
+
+    try:
+        yield ocr
+    finally:
+        for api in apis:
+            api.End()
+
+# Scanned pages are rendered at 200 DPI, where Tesseract's accuracy has mostly
+# saturated at under half the pixels of 300 DPI; pages that read as (nearly)
+# empty are retried at 300
+OCR_RESOLUTION = 200
+OCR_RETRY_RESOLUTION = 300
+
+def ocr_pdf(upload: BinaryIO, filename: str, psm: int = DEFAULT_OCR_PSM) -> str:
+    """
+    Extract PDF text with pdfplumber, OCR'ing pages that have no text layer
+    (blocking; run off the event loop).
+
+    Pages are rendered in order on this thread and OCR'd on a small pool
+    (Tesseract runs outside the GIL); a few renders are kept in flight at most.
+    Renders hold _pdfium_lock, since other requests may be in pdfium too.
+    Run with OMP_THREAD_LIMIT=1 so the pages' Tesseracts don't each start an
+    OpenMP thread per core.
+    """
+    workers = get_settings().ocr_concurrency_limit
+    pages_text: List[Any] = []  # page text, or the Future of its OCR
+    pending = deque()
+
+    with pdfplumber.open(upload) as pdf, tesseract_session(psm) as ocr, \
+            ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def collect(page_num: int, future: Future):
+            try:
+                text = future.result()
+                if len(text.strip()) < 10:
+                    # Next to nothing read at the fast resolution; retry at full
+                    with _pdfium_lock:
+                        img = pdf.pages[page_num].to_image(resolution=OCR_RETRY_RESOLUTION)
+                    text = ocr(to_grayscale(img.original))
+                pages_text[page_num] = text
+                logger.info(f"OCR'd PDF page {page_num + 1} of {filename}")
+            except Exception as ocr_err:
+                logger.warning(f"OCR failed for page {page_num + 1}: {ocr_err}")
+                pages_text[page_num] = ""
+
+        for page_num, page in enumerate(pdf.pages):
+            # Try text extraction first
+            text = page.extract_text()
+
+            # If no text found, convert to image and OCR
+            if not text or len(text.strip()) < 10:
+                try:
+                    # Convert page to image (pdfplumber renders with pdfium) and OCR
+                    with _pdfium_lock:
+                        img = page.to_image(resolution=OCR_RESOLUTION)
+                    pil_img = to_grayscale(img.original)
+                    text = pool.submit(ocr, pil_img)
+                    pending.append((page_num, text))
+                except Exception as ocr_err:
+                    logger.warning(f"OCR failed for page {page_num + 1}: {ocr_err}")
+                    text = ""
+
+            pages_text.append(text)
+
+            # Bound the rendered pages waiting for OCR
+            if len(pending) > 2 * workers:
+                collect(*pending.popleft())
+
+        while pending:
+            collect(*pending.popleft())
+
+        logger.info(f"Processed {len(pdf.pages)} pages of {filename} with pdfplumber+OCR")
+    return "\n".join(text for text in pages_text if text)
+
+def iter_csv_columns(stream: Iterable[str], columns: Tuple[str, ...]) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the stripped values of `columns` for each CSV row ("" when missing).
+    `stream` is anything csv.reader accepts (a text file, or decoded lines).
+
+    Column positions are resolved once from the header, so rows are read as
+    plain lists instead of building a DictReader dict per row.
+    """
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = {name: i for i, name in enumerate(header)}
+    indexes = [positions.get(column) for column in columns]
+    for row in reader:
+        if not row:
+            continue  # csv.DictReader skipped blank lines too
+        yield tuple(
+            row[i].strip() if i is not None and i < len(row) else ""
+            for i in indexes
+        )
+
+async def classify_signals_concurrently(
+    signals: Iterable[SignalInput],
+    background_tasks: Optional[BackgroundTasks],
+) -> AsyncIterator[Tuple[SignalInput, Union[ClassificationResult, BaseException]]]:
+    """
+    Run classify_signal over bulk-ingested signals, overlapping their LLM and
+    DB waits with at most BATCH_CONCURRENCY_LIMIT in flight.
+
+    Yields (signal, result or the exception it failed with) in the order of
+    `signals`. Signals are pulled from the iterable as slots free up, so a
+    lazily read upload is classified while it is still being read; results
+    that finish ahead of an earlier signal wait for it, at most twice the
+    limit of them. Each call gets its own session, since classify_signal
+    uses it from worker threads. SQLite still serializes their writes: a
+    writer waits up to SQLITE_BUSY_TIMEOUT for the lock, so keep the limit
+    low there.
+    """
+    async def classify_one(signal: SignalInput) -> Union[ClassificationResult, BaseException]:
+        db = SessionLocal()
+        try:
+            return await classify_signal_func(signal, background_tasks, db)
+        except Exception as e:
+            return e
+        finally:
+            db.close()
+
+    limit = max(1, get_settings().batch_concurrency_limit)
+    remaining = iter(signals)
+    pending = deque()  # (signal, task) not yet yielded, in input order
+    try:
+        while True:
+            running = {task for _, task in pending if not task.done()}
+            starts = max(0, min(limit - len(running), 2 * limit - len(pending)))
+            for signal in islice(remaining, starts):
+                task = asyncio.ensure_future(classify_one(signal))
+                pending.append((signal, task))
+                running.add(task)
+            if not pending:
+                return
+
+            if pending[0][1].done():
+                while pending and pending[0][1].done():
+                    signal, task = pending.popleft()
+                    yield signal, task.result()
+            else:
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for _, task in pending:
+            task.cancel()
+
 @router.post("/ocr", response_model=OCRResult)
 async def ingest_ocr(
     file: UploadFile = File(...),
     use_ocr_for_pdf: bool = False,
+    psm: int = Query(DEFAULT_OCR_PSM, ge=1, le=13),
     db: Session = Depends(get_db),
 ):
     """
@@ -149,16 +401,19 @@ async def ingest_ocr(
     Args:
         file: Image or PDF file
         use_ocr_for_pdf: If True, use pdfplumber + OCR for scanned PDFs (slower but works on scanned docs)
+        psm: Tesseract page segmentation mode (default 6, one block of text;
+            use 3 for multi-column pages, 11 for sparse text)
     """
     try:
-        # Read file
-        contents = await file.read()
+        # The upload is already spooled to a temp file (on disk when large);
+        # parsers read it in place rather than from an in-memory copy
+        upload = file.file
 
-        # Extract text based on file type
+        # Extract text based on file type; OCR and PDF parsing are CPU-bound,
+        # so they run in a worker thread instead of blocking the event loop
         if file.content_type.startswith("image"):
             # Image handling: use Tesseract OCR
-            image = Image.open(io.BytesIO(contents))
-            extracted_text = pytesseract.image_to_string(image, lang='eng')
+            extracted_text = await asyncio.to_thread(ocr_image, upload, psm)
             logger.info(f"OCR'd image: {file.filename}")
 
         elif file.content_type == "application/pdf" or file.filename.endswith(".pdf"):
@@ -166,50 +421,17 @@ async def ingest_ocr(
             if use_ocr_for_pdf and pdfplumber:
                 # Mode 1: pdfplumber + OCR (for scanned PDFs/business cards)
                 try:
-                    pdf_file = io.BytesIO(contents)
-                    pages_text = []
-
-                    with pdfplumber.open(pdf_file) as pdf:
-                        for page_num, page in enumerate(pdf.pages):
-                            # Try text extraction first
-                            text = page.extract_text()
-
-                            # If no text found, convert to image and OCR
-                            if not text or len(text.strip()) < 10:
-                                try:
-                                    # Convert page to image and OCR
-                                    img = page.to_image(resolution=300)
-                                    pil_img = img.original
-                                    text = pytesseract.image_to_string(pil_img, lang='eng')
-                                    logger.info(f"OCR'd PDF page {page_num + 1} of {file.filename}")
-                                except Exception as ocr_err:
-                                    logger.warning(f"OCR failed for page {page_num + 1}: {ocr_err}")
-                                    text = ""
-
-                            if text:
-                                pages_text.append(text)
-
-                    extracted_text = "\n".join(pages_text)
-                    logger.info(f"Processed {len(pdf.pages)} pages of {file.filename} with pdfplumber+OCR")
-
+                    extracted_text = await asyncio.to_thread(ocr_pdf, upload, file.filename, psm)
                 except Exception as pdf_err:
                     raise HTTPException(status_code=400, detail=f"Failed to parse PDF with pdfplumber: {str(pdf_err)}")
 
             else:
-                # Mode 2: Fast text extraction with pypdf (default)
-                if PdfReader is None:
+                # Mode 2: Fast text extraction with pdfium/pypdf (default)
+                if PdfReader is None and pdfium is None:
                     raise HTTPException(status_code=500, detail="PDF support not available. Install pypdf: pip install pypdf")
 
                 try:
-                    pdf_file = io.BytesIO(contents)
-                    reader = PdfReader(pdf_file)
-                    pages_text = []
-                    for page_num, page in enumerate(reader.pages):
-                        text = page.extract_text()
-                        if text:
-                            pages_text.append(text)
-                    extracted_text = "\n".join(pages_text)
-                    logger.info(f"Extracted text from {len(reader.pages)} pages of {file.filename}")
+                    extracted_text = await asyncio.to_thread(extract_pdf_text, upload, file.filename)
                 except Exception as pdf_err:
                     # If pypdf fails, suggest using OCR mode
                     raise HTTPException(
@@ -225,9 +447,10 @@ async def ingest_ocr(
         if not extracted_text:
             raise HTTPException(status_code=400, detail="Failed to extract text from file. Try use_ocr_for_pdf=true for scanned PDFs.")
 
-        # Extract contact info
-        emails = extract_emails(extracted_text)
-        phones = extract_phones(extracted_text)
+        # Extract contact info; skip the email/phone scans when the text can't
+        # contain one (no "@" / no digit at all), e.g. plain job descriptions
+        emails = extract_emails(extracted_text) if '@' in extracted_text else []
+        phones = extract_phones(extracted_text) if _DIGIT_RE.search(extracted_text) else []
         names = extract_names(extracted_text)
         company = extract_company(extracted_text)
 
@@ -249,36 +472,30 @@ async def ingest_ocr(
 async def ingest_ocr_and_classify(
     file: UploadFile = File(...),
     company_name: Optional[str] = None,
+    psm: int = Query(DEFAULT_OCR_PSM, ge=1, le=13),
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
 ):
     """
     Upload a file (image or PDF), extract text, and immediately classify as a lead.
     If score > threshold, queue dossier generation (background task).
+    `psm` is the Tesseract page segmentation mode used for images.
     """
     try:
-        # Step 1: Extract text
-        contents = await file.read()
+        # Step 1: Extract text (parsers read the spooled upload in place)
+        upload = file.file
 
         if file.content_type.startswith("image"):
-            # Image: OCR with Tesseract
-            image = Image.open(io.BytesIO(contents))
-            extracted_text = pytesseract.image_to_string(image, lang='eng')
+            # Image: OCR with Tesseract (in a worker thread)
+            extracted_text = await asyncio.to_thread(ocr_image, upload, psm)
             source_type = "ocr_image"
         elif file.content_type == "application/pdf" or file.filename.endswith(".pdf"):
             # PDF: text extraction
-            if PdfReader is None:
+            if PdfReader is None and pdfium is None:
                 raise HTTPException(status_code=500, detail="PDF support not available. Install: pip install pypdf")
 
             try:
-                pdf_file = io.BytesIO(contents)
-                reader = PdfReader(pdf_file)
-                pages_text = []
-                for page in reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        pages_text.append(text)
-                extracted_text = "\n".join(pages_text)
+                extracted_text = await asyncio.to_thread(extract_pdf_text, upload, file.filename)
                 source_type = "ocr_pdf"
             except Exception as pdf_err:
                 raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {str(pdf_err)}")
@@ -319,55 +536,54 @@ async def ingest_csv(
     Returns summary of created leads.
     """
     try:
-        import io as stdio
-
-        contents = await file.read()
-        stream = stdio.StringIO(contents.decode("utf8"))
-        csv_reader = csv.DictReader(stream)
-
-        results = []
-        processed_count = 0
-
-        for row in csv_reader:
-            signal_text = row.get("signal_text", "").strip()
-            company_name = row.get("company_name", "").strip()
-
-            if not signal_text:
-                continue  # Skip empty rows
-
-            processed_count += 1
-
-            # Create signal input
-            signal = SignalInput(
+        # Rows are read and decoded straight from the spooled upload file, and
+        # each is classified as soon as a slot is free instead of after the
+        # whole file has been parsed
+        stream = codecs.iterdecode(file.file, "utf-8")
+        rows = iter_csv_columns(stream, ("signal_text", "company_name", "company_website"))
+
+        signals = (
+            SignalInput(
                 signal_text=signal_text,
                 source_type="csv",
                 company_name=company_name or None,
-                company_website=row.get("company_website") or None,
+                company_website=company_website or None,
             )
+            for signal_text, company_name, company_website in rows
+            if signal_text  # Skip empty rows
+        )
 
-            # Classify synchronously (for CSV, we do batch processing)
-            try:
-                result = await classify_signal_func(signal, background_tasks, db)
-                results.append({
-                    "company": company_name,
-                    "score": result.total_score,
-                    "bucket": result.score_bucket,
-                    "lead_id": result.lead_id,
-                    "status": "created",
-                })
-            except Exception as e:
-                logger.error(f"Error classifying CSV row {processed_count}: {e}")
+        processed_count = 0
+        results = []
+        created_count = 0
+
+        # Classify the rows concurrently (bounded); results keep row order
+        async for signal, result in classify_signals_concurrently(signals, background_tasks):
+            processed_count += 1
+            company_name = signal.company_name or ""
+            if isinstance(result, BaseException):
+                logger.error(f"Error classifying CSV row {processed_count}: {result}")
                 results.append({
                     "company": company_name,
                     "status": "error",
-                    "error": str(e),
+                    "error": str(result),
                 })
+                continue
+
+            created_count += 1
+            results.append({
+                "company": company_name,
+                "score": result.total_score,
+                "bucket": result.score_bucket,
+                "lead_id": result.lead_id,
+                "status": "created",
+            })
 
         return {
             "total_processed": processed_count,
-            "total_created": len([r for r in results if r.get("status") == "created"]),
+            "total_created": created_count,
             "results": results,
-            "message": f"Processed {processed_count} rows, created {len([r for r in results if r.get('status') == 'created'])} leads",
+            "message": f"Processed {processed_count} rows, created {created_count} leads",
         }
 
     except Exception as e:
@@ -403,72 +619,70 @@ async def ingest_jobs_csv(
     Returns summary of created leads.
     """
     try:
-        import io as stdio
+        # Rows are read and decoded straight from the spooled upload file, and
+        # each is classified as soon as a slot is free instead of after the
+        # whole file has been parsed
+        stream = codecs.iterdecode(file.file, "utf-8")
+        rows = iter_csv_columns(
+            stream, ("company_name", "title", "description", "location", "posted_at", "company_website")
+        )
 
-        contents = await file.read()
-        stream = stdio.StringIO(contents.decode("utf8"))
-        csv_reader = csv.DictReader(stream)
+        titles = deque()  # Titles of the rows read but not yet reported, in row order
+
+        def job_signals():
+            for company_name, title, description, location, posted_at, company_website in rows:
+                if not company_name or not description:
+                    continue  # Skip rows without essential data
+
+                # Build job signal text (empty fields drop out)
+                signal_text = "\n".join(filter(None, (
+                    title and f"Job Title: {title}",
+                    location and f"Location: {location}",
+                    posted_at and f"Posted: {posted_at}",
+                    f"Description: {description}",
+                )))
+
+                titles.append(title)
+                yield SignalInput(
+                    signal_text=signal_text,
+                    source_type="job_post",
+                    company_name=company_name,
+                    company_website=company_website or None,
+                )
 
-        results = []
         processed_count = 0
+        results = []
+        created_count = 0
 
-        for row in csv_reader:
-            company_name = row.get("company_name", "").strip()
-            title = row.get("title", "").strip()
-            description = row.get("description", "").strip()
-            location = row.get("location", "").strip()
-            posted_at = row.get("posted_at", "").strip()
-
-            if not company_name or not description:
-                continue  # Skip rows without essential data
-
+        # Classify the rows concurrently (bounded); results keep row order
+        async for signal, result in classify_signals_concurrently(job_signals(), background_tasks):
             processed_count += 1
-
-            # Build job signal text
-            signal_parts = []
-            if title:
-                signal_parts.append(f"Job Title: {title}")
-            if location:
-                signal_parts.append(f"Location: {location}")
-            if posted_at:
-                signal_parts.append(f"Posted: {posted_at}")
-            signal_parts.append(f"Description: {description}")
-
-            signal_text = "\n".join(signal_parts)
-
-            # Create signal input
-            signal = SignalInput(
-                signal_text=signal_text,
-                source_type="job_post",
-                company_name=company_name,
-                company_website=row.get("company_website") or None,
-            )
-
-            # Classify synchronously
-            try:
-                result = await classify_signal_func(signal, background_tasks, db)
+            title = titles.popleft()
+            if isinstance(result, BaseException):
+                logger.error(f"Error classifying job row {processed_count}: {result}")
                 results.append({
-                    "company": company_name,
-                    "title": title,
-                    "score": result.total_score,
-                    "bucket": result.score_bucket,
-                    "lead_id": result.lead_id,
-                    "status": "created",
-                })
-            except Exception as e:
-                logger.error(f"Error classifying job row {processed_count}: {e}")
-                results.append({
-                    "company": company_name,
+                    "company": signal.company_name,
                     "title": title,
                     "status": "error",
-                    "error": str(e),
+                    "error": str(result),
                 })
+                continue
+
+            created_count += 1
+            results.append({
+                "company": signal.company_name,
+                "title": title,
+                "score": result.total_score,
+                "bucket": result.score_bucket,
+                "lead_id": result.lead_id,
+                "status": "created",
+            })
 
         return {
             "total_processed": processed_count,
-            "total_created": len([r for r in results if r.get("status") == "created"]),
+            "total_created": created_count,
             "results": results,
-            "message": f"Processed {processed_count} job rows, created {len([r for r in results if r.get('status') == 'created'])} leads",
+            "message": f"Processed {processed_count} job rows, created {created_count} leads",
         }
 
     except Exception as e:
@@ -506,46 +720,52 @@ async def ingest_json_bulk(
     ]
     """
     try:
-        results = []
-        processed_count = 0
+        indexes = []
+        signal_inputs = []
 
         for idx, json_signal in enumerate(signals):
             if not json_signal.company_name or not json_signal.signal_text:
                 continue
 
-            processed_count += 1
-
             # Create signal input
-            signal = SignalInput(
+            indexes.append(idx)
+            signal_inputs.append(SignalInput(
                 signal_text=json_signal.signal_text,
                 source_type=json_signal.source_type or "json",
                 company_name=json_signal.company_name,
                 company_website=json_signal.company_website,
-            )
+            ))
 
-            # Classify
-            try:
-                result = await classify_signal_func(signal, background_tasks, db)
-                results.append({
-                    "company": json_signal.company_name,
-                    "score": result.total_score,
-                    "bucket": result.score_bucket,
-                    "lead_id": result.lead_id,
-                    "status": "created",
-                })
-            except Exception as e:
-                logger.error(f"Error classifying JSON signal {idx}: {e}")
+        processed_count = len(signal_inputs)
+        results = []
+        created_count = 0
+
+        # Classify concurrently (bounded); results keep request order
+        outcomes = [result async for _, result in classify_signals_concurrently(signal_inputs, background_tasks)]
+        for idx, signal, result in zip(indexes, signal_inputs, outcomes):
+            if isinstance(result, BaseException):
+                logger.error(f"Error classifying JSON signal {idx}: {result}")
                 results.append({
-                    "company": json_signal.company_name,
+                    "company": signal.company_name,
                     "status": "error",
-                    "error": str(e),
+                    "error": str(result),
                 })
+                continue
+
+            created_count += 1
+            results.append({
+                "company": signal.company_name,
+                "score": result.total_score,
+                "bucket": result.score_bucket,
+                "lead_id": result.lead_id,
+                "status": "created",
+            })
 
         return {
             "total_processed": processed_count,
-            "total_created": len([r for r in results if r.get("status") == "created"]),
+            "total_created": created_count,
             "results": results,
-            "message": f"Processed {processed_count} signals, created {len([r for r in results if r.get('status') == 'created'])} leads",
+            "message": f"Processed {processed_count} signals, created {created_count} leads",
         }
 
     except Exception as e:
@@ -553,6 +773,16 @@ async def ingest_json_bulk(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Job description containers, most specific first
+LINKEDIN_TEXT_SELECTORS = (
+    'div.description__text',
+    'div.show-more-less-html__markup',
+    'div[class*="description"]',
+    'article',
+    'main',
+)
+
+
 class LinkedInPostInput(BaseModel):
     """Schema for LinkedIn post URL input."""
     post_url: str
@@ -591,30 +821,25 @@ async def ingest_linkedin_post(
                 )
 
         # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Extract text (LinkedIn's structure varies, try multiple selectors)
-        text_elements = []
-
-        # Try job description containers
-        for selector in [
-            'div.description__text',
-            'div.show-more-less-html__markup',
-            'div[class*="description"]',
-            'article',
-            'main',
-        ]:
-            elements = soup.select(selector)
-            for elem in elements:
-                text = elem.get_text(strip=True, separator='\n')
-                if text and len(text) > 50:
-                    text_elements.append(text)
+        soup = BeautifulSoup(response.text, 'lxml')
+
+        # Extract text (LinkedIn's structure varies, try multiple selectors).
+        # Selectors go from most to least specific and the broader ones contain
+        # the narrower ones, so stop at the first that yields text
+        extracted_text = ""
+        for selector in LINKEDIN_TEXT_SELECTORS:
+            text_elements = [
+                text
+                for elem in soup.select(selector)
+                if len(text := elem.get_text(strip=True, separator='\n')) > 50
+            ]
+            if text_elements:
+                extracted_text = "\n\n".join(text_elements)
+                break
 
         # Fallback: get all text
-        if not text_elements:
-            text_elements = [soup.get_text(strip=True, separator='\n')]
-
-        extracted_text = "\n\n".join(text_elements)
+        if not extracted_text:
+            extracted_text = soup.get_text(strip=True, separator='\n')
 
         if not extracted_text or len(extracted_text) < 20:
             raise HTTPException(
@@ -640,7 +865,7 @@ async def ingest_linkedin_post(
 
         result = await classify_signal_func(signal, background_tasks, db)
         return {
-            **result.dict(),
+            **result.model_dump(),
             "extracted_text_preview": extracted_text[:500] + "..." if len(extracted_text) > 500 else extracted_text,
         }
 
@@ -658,6 +883,78 @@ class RSSFeedInput(BaseModel):
     max_items: int = 20
 
 
+_TAG_RE = re.compile(r'<[^>]+>')
+# Beyond this many tags a description is parsed properly rather than regex-stripped
+_STRIP_HTML_MAX_TAGS = 50
+
+def strip_html(fragment: str) -> str:
+    """
+    Text of a short HTML snippet (e.g. an RSS description).
+
+    Typical snippets are stripped with a tag regex and unescaped; only heavily
+    marked-up ones go through a full BeautifulSoup parse.
+    """
+    if BeautifulSoup and fragment.count('<') > _STRIP_HTML_MAX_TAGS:
+        return BeautifulSoup(fragment, 'lxml').get_text()
+    return html.unescape(_TAG_RE.sub(' ', fragment))
+
+# feed_url -> (ETag, Last-Modified, parsed feed) for conditional re-fetches
+_feed_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+_FEED_CACHE_MAX_SIZE = 100
+
+def _cache_feed(feed_url: str, etag: Optional[str], modified: Optional[str], feed) -> None:
+    """Remember a feed's validators (oldest entries are evicted first)."""
+    _feed_cache.pop(feed_url, None)
+    if etag or modified:
+        _feed_cache[feed_url] = (etag, modified, feed)
+        while len(_feed_cache) > _FEED_CACHE_MAX_SIZE:
+            del _feed_cache[next(iter(_feed_cache))]
+
+async def fetch_feed(feed_url: str):
+    """
+    Download and parse an RSS/Atom feed without blocking the event loop.
+
+    The download goes through httpx's async client; feedparser only parses
+    the body, in a worker thread. Without httpx, feedparser fetches the URL
+    itself (in the thread). Feeds are re-fetched with a conditional GET, and
+    an unchanged feed (304) is served from the last parse. An error status
+    from the feed's server raises a 404 (feed gone) or 502 HTTPException.
+    """
+    etag, modified, cached = _feed_cache.get(feed_url, (None, None, None))
+
+    if not httpx:
+        feed = await asyncio.to_thread(feedparser.parse, feed_url, etag=etag, modified=modified)
+        if feed.get("status") == 304 and cached is not None:
+            return cached
+        _cache_feed(feed_url, feed.get("etag"), feed.get("modified"), feed)
+        return feed
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        response = await client.get(feed_url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached
+        if response.is_error:
+            # The feed's failure, not ours: a gone feed is a 404, anything else a 502
+            status_code = 404 if response.status_code in (404, 410) else 502
+            raise HTTPException(
+                status_code=status_code,
+                detail=f"Feed URL returned HTTP {response.status_code}",
+            )
+
+    # Headers let feedparser pick up the declared charset
+    feed = await asyncio.to_thread(
+        feedparser.parse, response.content, response_headers=dict(response.headers.items())
+    )
+    _cache_feed(feed_url, response.headers.get("etag"), response.headers.get("last-modified"), feed)
+    return feed
+
+
 @router.post("/rss/fetch")
 async def fetch_rss_feed(
     input_data: RSSFeedInput,
@@ -677,8 +974,8 @@ async def fetch_rss_feed(
         raise HTTPException(status_code=500, detail="feedparser not available. Install: pip install feedparser")
 
     try:
-        # Parse the feed
-        feed = feedparser.parse(input_data.feed_url)
+        # Fetch and parse the feed
+        feed = await fetch_feed(input_data.feed_url)
 
         if feed.bozo:
             # Feed has errors
@@ -694,6 +991,8 @@ async def fetch_rss_feed(
 
         results = []
         processed_count = 0
+        items = []
+        signals = []
 
         # Process feed items (limit to max_items)
         for entry in feed.entries[:input_data.max_items]:
@@ -703,53 +1002,26 @@ async def fetch_rss_feed(
             link = entry.get("link", "")
             published = entry.get("published", "") or entry.get("updated", "")
 
-            # Build signal text
-            signal_parts = []
-            if title:
-                signal_parts.append(f"Title: {title}")
-            if published:
-                signal_parts.append(f"Published: {published}")
-            if description:
-                # Clean HTML tags from description
-                if BeautifulSoup:
-                    clean_desc = BeautifulSoup(description, 'html.parser').get_text()
-                    signal_parts.append(f"Description: {clean_desc}")
-                else:
-                    signal_parts.append(f"Description: {description}")
-
-            signal_text = "\n".join(signal_parts)
+            # Build signal text (empty fields drop out; HTML cleaned from description)
+            signal_text = "\n".join(filter(None, (
+                title and f"Title: {title}",
+                published and f"Published: {published}",
+                description and f"Description: {strip_html(description)}",
+            )))
 
             if not signal_text or len(signal_text) < 20:
                 continue
 
             processed_count += 1
 
-            # Auto-classify if enabled
+            # Auto-classify if enabled (all items at once, below)
             if input_data.auto_classify:
-                try:
-                    signal = SignalInput(
-                        signal_text=signal_text,
-                        source_type="rss_feed",
-                        source_url=link,
-                    )
-
-                    result = await classify_signal_func(signal, background_tasks, db)
-                    results.append({
-                        "title": title,
-                        "link": link,
-                        "score": result.total_score,
-                        "bucket": result.score_bucket,
-                        "lead_id": result.lead_id,
-                        "status": "classified",
-                    })
-                except Exception as e:
-                    logger.error(f"Error classifying RSS item: {e}")
-                    results.append({
-                        "title": title,
-                        "link": link,
-                        "status": "error",
-                        "error": str(e),
-                    })
+                items.append((title, link))
+                signals.append(SignalInput(
+                    signal_text=signal_text,
+                    source_type="rss_feed",
+                    source_url=link,
+                ))
             else:
                 # Just return the parsed data
                 results.append({
@@ -760,6 +1032,28 @@ async def fetch_rss_feed(
                     "status": "parsed",
                 })
 
+        # Classify the items concurrently (bounded); results keep feed order
+        outcomes = [result async for _, result in classify_signals_concurrently(signals, background_tasks)]
+        for (title, link), result in zip(items, outcomes):
+            if isinstance(result, BaseException):
+                logger.error(f"Error classifying RSS item: {result}")
+                results.append({
+                    "title": title,
+                    "link": link,
+                    "status": "error",
+                    "error": str(result),
+                })
+                continue
+
+            results.append({
+                "title": title,
+                "link": link,
+                "score": result.total_score,
+                "bucket": result.score_bucket,
+                "lead_id": result.lead_id,
+                "status": "classified",
+            })
+
         return {
             "feed_title": feed.feed.get("title", "Unknown"),
             "feed_link": feed.feed.get("link", ""),
@@ -770,6 +1064,8 @@ async def fetch_rss_feed(
             "message": f"Processed {processed_count} items from RSS feed",
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching RSS feed: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to process RSS feed: {str(e)}")
@@ -1,21 +1,15 @@
 """Lead management - CRUD and scoring."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
-from database import Lead, Company, Contact, Signal, SessionLocal
-from pydantic import BaseModel
+from database import Lead, Company, Contact, Signal, get_db
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from datetime import datetime
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # Pydantic schemas
 class CompanySimple(BaseModel):
     id: int
@@ -23,8 +17,7 @@ class CompanySimple(BaseModel):
     website: Optional[str]
     sector: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ContactSimple(BaseModel):
     id: int
@@ -33,8 +26,7 @@ class ContactSimple(BaseModel):
     email: Optional[str]
     phone_numbers: list
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class LeadResponse(BaseModel):
     id: int
@@ -56,8 +48,11 @@ class LeadResponse(BaseModel):
     company: Optional[CompanySimple]
     contact: Optional[ContactSimple]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Built once; validating and dumping a page in one pass replaces FastAPI's
+# per-request response_model handling for list_leads
+_LEAD_LIST_ADAPTER = TypeAdapter(List[LeadResponse])
 
 class LeadFilter(BaseModel):
     score_min: int = 0
@@ -75,10 +70,20 @@ def list_leads(
     score_bucket: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
+    after_score: Optional[float] = None,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db),
 ):
-    """List leads with filtering."""
-    query = db.query(Lead)
+    """
+    List leads with filtering.
+
+    Pages with `offset`, or with a keyset cursor: pass the `total_score` and
+    `id` of the last lead of the previous page as `after_score`/`after_id` to
+    seek straight to the next page instead of scanning past `offset` rows.
+    """
+    # LeadResponse serializes company and contact; load them for the whole page
+    # in two IN queries instead of two lazy loads per lead
+    query = db.query(Lead).options(selectinload(Lead.company), selectinload(Lead.contact))
 
     # Apply filters
     if score_min:
@@ -89,10 +94,19 @@ def list_leads(
         query = query.filter(Lead.status == status)
     if score_bucket:
         query = query.filter(Lead.score_bucket == score_bucket)
-
-    # Sort by score descending (hottest first)
-    leads = query.order_by(Lead.total_score.desc()).offset(offset).limit(limit).all()
-    return leads
+    if after_score is not None and after_id is not None:
+        query = query.filter(or_(
+            Lead.total_score < after_score,
+            and_(Lead.total_score == after_score, Lead.id < after_id),
+        ))
+
+    # Sort by score descending (hottest first); id breaks ties so pages are stable
+    leads = query.order_by(Lead.total_score.desc(), Lead.id.desc()).offset(offset).limit(limit).all()
+    # Returning a Response skips the response_model pass (kept for the OpenAPI schema)
+    return Response(
+        content=_LEAD_LIST_ADAPTER.dump_json(_LEAD_LIST_ADAPTER.validate_python(leads)),
+        media_type="application/json",
+    )
 
 @router.get("/{lead_id}", response_model=LeadResponse)
 def get_lead(lead_id: int, db: Session = Depends(get_db)):
@@ -105,28 +119,27 @@ def get_lead(lead_id: int, db: Session = Depends(get_db)):
 @router.patch("/{lead_id}/status")
 def update_lead_status(lead_id: int, status: str, db: Session = Depends(get_db)):
     """Update lead status."""
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
-
     valid_statuses = ["new", "contacted", "qualified", "pitched", "trial", "won", "lost", "parked"]
     if status not in valid_statuses:
         raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
 
-    lead.status = status
-    lead.updated_at = datetime.utcnow()
+    # Single UPDATE instead of loading the full (JSON-heavy) lead row
+    result = db.execute(
+        update(Lead).where(Lead.id == lead_id).values(status=status)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Lead not found")
     db.commit()
     return {"status": "ok", "lead_id": lead_id, "new_status": status}
 
 @router.patch("/{lead_id}/notes")
 def update_lead_notes(lead_id: int, notes: str, db: Session = Depends(get_db)):
     """Update lead notes."""
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if not lead:
+    result = db.execute(
+        update(Lead).where(Lead.id == lead_id).values(notes=notes)
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Lead not found")
-
-    lead.notes = notes
-    lead.updated_at = datetime.utcnow()
     db.commit()
     return {"status": "ok"}
 
@@ -135,16 +148,16 @@ def get_bucket_counts(db: Session = Depends(get_db)):
     """Get count of leads by score bucket."""
     from sqlalchemy import func
 
-    counts = db.query(
+    counts = dict(db.query(
         Lead.score_bucket,
         func.count(Lead.id).label("count")
-    ).group_by(Lead.score_bucket).all()
+    ).group_by(Lead.score_bucket).all())
 
     return {
-        "red_hot": next((c[1] for c in counts if c[0] == "red_hot"), 0),
-        "warm": next((c[1] for c in counts if c[0] == "warm"), 0),
-        "nurture": next((c[1] for c in counts if c[0] == "nurture"), 0),
-        "parked": next((c[1] for c in counts if c[0] == "parked"), 0),
+        "red_hot": counts.get("red_hot", 0),
+        "warm": counts.get("warm", 0),
+        "nurture": counts.get("nurture", 0),
+        "parked": counts.get("parked", 0),
     }
 
 @router.delete("/{lead_id}")
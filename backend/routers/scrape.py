@@ -74,8 +74,9 @@ async def scrape_job_boards(
     try:
         logger.info(f"Starting job board scrape: {request.query}")
 
-        # Run scraping in background
-        results = scraping_service.scrape_job_boards(
+        # Run scraping on the service's worker pool, off the event loop
+        results = await scraping_service.run_in_executor(
+            scraping_service.scrape_job_boards,
             query=request.query,
             location=request.location or "",
             sources=request.sources,
@@ -128,7 +129,8 @@ async def scrape_company_website(
     try:
         logger.info(f"Starting company website scrape: {request.url}")
 
-        results = scraping_service.scrape_company_website(
+        results = await scraping_service.run_in_executor(
+            scraping_service.scrape_company_website,
             url=str(request.url),
             company_name=request.company_name,
             deep_scan=request.deep_scan or False
@@ -175,7 +177,8 @@ async def discover_leads(
     try:
         logger.info(f"Starting lead discovery: {request.search_query}")
 
-        results = scraping_service.discover_leads(
+        results = await scraping_service.run_in_executor(
+            scraping_service.discover_leads,
             search_query=request.search_query,
             num_results=request.num_results or 20,
             scrape_companies=request.scrape_companies or False
@@ -220,7 +223,8 @@ async def scrape_career_page(
     try:
         logger.info(f"Starting career page scrape: {request.url}")
 
-        results = scraping_service.scrape_career_page(
+        results = await scraping_service.run_in_executor(
+            scraping_service.scrape_career_page,
             url=str(request.url),
             company_name=request.company_name
         )
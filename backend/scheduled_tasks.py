@@ -48,7 +48,7 @@ async def scheduled_job_board_poll():
             max_results_per_board=25
         )
 
-        logger.info(f"Fetched {len(jobs)} jobs from job boards")
+        logger.info("Fetched %s jobs from job boards", len(jobs))
 
         # Classify each job
         created_leads = []
@@ -77,9 +77,9 @@ async def scheduled_job_board_poll():
                     })
 
             except Exception as e:
-                logger.error(f"Error classifying job from {job.company_name}: {e}")
+                logger.error("Error classifying job from %s: %s", job.company_name, e)
 
-        logger.info(f"Scheduled job poll complete. Created {len(created_leads)} leads.")
+        logger.info("Scheduled job poll complete. Created %s leads.", len(created_leads))
 
         # Optionally: Send summary email/notification here
         return {
@@ -89,7 +89,7 @@ async def scheduled_job_board_poll():
         }
 
     except Exception as e:
-        logger.error(f"Error in scheduled job board poll: {e}")
+        logger.error("Error in scheduled job board poll: %s", e)
         return {"error": str(e)}
 
     finally:
@@ -149,9 +149,9 @@ async def scheduled_rss_feed_monitor():
                         total_items_processed += 1
 
             except Exception as e:
-                logger.error(f"Error processing RSS feed {feed_url}: {e}")
+                logger.error("Error processing RSS feed %s: %s", feed_url, e)
 
-        logger.info(f"RSS feed monitor complete. Processed {total_items_processed} items.")
+        logger.info("RSS feed monitor complete. Processed %s items.", total_items_processed)
 
         db.close()
         return {
@@ -165,7 +165,7 @@ async def scheduled_rss_feed_monitor():
         return {"error": "feedparser not installed"}
 
     except Exception as e:
-        logger.error(f"Error in scheduled RSS feed monitor: {e}")
+        logger.error("Error in scheduled RSS feed monitor: %s", e)
         return {"error": str(e)}
 
 
@@ -255,8 +255,8 @@ def trigger_job_now(job_id: str):
     job = scheduler.get_job(job_id)
     if job:
         job.modify(next_run_time=datetime.now())
-        logger.info(f"Manually triggered job: {job_id}")
+        logger.info("Manually triggered job: %s", job_id)
         return True
     else:
-        logger.error(f"Job not found: {job_id}")
+        logger.error("Job not found: %s", job_id)
         return False
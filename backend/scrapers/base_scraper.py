@@ -141,10 +141,10 @@ class BaseScraper:
 
     def extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
         emails = re.findall(email_pattern, text)
         # Filter out common garbage emails
-        filtered = []
+        filtered = set()
         garbage_patterns = [
             r'example\.com$',
             r'test\.com$',
@@ -155,8 +155,8 @@ class BaseScraper:
         ]
         for email in emails:
             if not any(re.search(pattern, email, re.IGNORECASE) for pattern in garbage_patterns):
-                filtered.append(email.lower())
-        return list(set(filtered))
+                filtered.add(email.lower())
+        return list(filtered)
 
     def extract_phones(self, text: str) -> List[str]:
         """Extract phone numbers from text"""
@@ -167,10 +167,10 @@ class BaseScraper:
             r'\(\d{3}\)[-\s]?\d{3}[-\s]?\d{4}',  # (123) 456-7890
             r'\d{3}[-\s]?\d{3}[-\s]?\d{4}',  # 123-456-7890
         ]
-        phones = []
+        phones = set()
         for pattern in patterns:
-            phones.extend(re.findall(pattern, text))
-        return list(set(phones))
+            phones.update(re.findall(pattern, text))
+        return list(phones)
 
     def extract_social_links(self, soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
         """Extract social media links from page"""
@@ -5,13 +5,16 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
 from .job_scrapers import IndeedScraper, NaukriScraper, LinkedInJobsScraper, GenericJobScraper
 from .company_scraper import CompanyScraper, LeadDiscoveryScraper
-from ..database import Company, Contact, Signal, Lead, SessionLocal
+from ..config import get_settings
+from ..database import Company, Contact, Signal, Lead, SessionLocal, company_insert
 from ..ollama_wrapper import classify_signal_with_ollama
 
 logger = logging.getLogger(__name__)
@@ -31,6 +34,17 @@ class ScrapingService:
         self.generic_job_scraper = GenericJobScraper(rate_limit=2.0)
         self.executor = ThreadPoolExecutor(max_workers=3)
 
+    async def run_in_executor(self, func, *args, **kwargs):
+        """
+        Run a blocking scrape on the service's worker pool
+
+        Scrapers use requests with rate-limit sleeps, so calling them directly
+        from an async endpoint would stall every other request; the pool also
+        caps how many scrapes run at once.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
     def scrape_job_boards(
         self,
         query: str,
@@ -189,24 +203,35 @@ class ScrapingService:
             results['urls_found'] = len(search_results)
             results['discovered_urls'] = [r['url'] for r in search_results]
 
-            # Optionally scrape each discovered company
-            if scrape_companies:
-                for result in search_results:
-                    try:
-                        company_url = result['url']
-                        logger.info(f"Scraping discovered company: {company_url}")
-
-                        company_result = self.scrape_company_website(
+            # Optionally scrape each discovered company. Each site is a different
+            # domain (rate limits are per domain) and gets its own DB session, so
+            # the scrapes overlap on a small pool instead of waiting on each other.
+            # A local pool: this method itself runs on self.executor.
+            if scrape_companies and search_results:
+                company_urls = [r['url'] for r in search_results]
+                max_workers = min(get_settings().batch_concurrency_limit, len(company_urls))
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = {
+                        pool.submit(
+                            self.scrape_company_website,
                             company_url,
                             deep_scan=False  # Quick scan for discovery
-                        )
+                        ): company_url
+                        for company_url in company_urls
+                    }
+                    logger.info(f"Scraping {len(futures)} discovered companies")
 
-                        results['companies_scraped'] += 1
-                        results['leads_created'] += company_result.get('leads_created', 0)
+                    for future in as_completed(futures):
+                        company_url = futures[future]
+                        try:
+                            company_result = future.result()
 
-                    except Exception as e:
-                        logger.error(f"Error scraping discovered company {company_url}: {e}")
-                        results['errors'].append(f"{company_url}: {str(e)}")
+                            results['companies_scraped'] += 1
+                            results['leads_created'] += company_result.get('leads_created', 0)
+
+                        except Exception as e:
+                            logger.error(f"Error scraping discovered company {company_url}: {e}")
+                            results['errors'].append(f"{company_url}: {str(e)}")
 
         except Exception as e:
             logger.error(f"Error discovering leads: {e}")
@@ -269,6 +294,8 @@ class ScrapingService:
         """
         leads_created = 0
         db = SessionLocal()
+        # Job boards list many openings per company; resolve each company once
+        companies: Dict[str, Company] = {}
 
         try:
             for job in jobs:
@@ -278,13 +305,16 @@ class ScrapingService:
                         continue
 
                     # Get or create company
-                    company = self._get_or_create_company(db, company_name, job.get('url'))
+                    company = companies.get(company_name.lower())
+                    if company is None:
+                        company = self._get_or_create_company(db, company_name, job.get('url'))
+                        companies[company_name.lower()] = company
 
                     # Create signal from job posting
                     signal_text = self._format_job_signal(job)
 
                     # Check for duplicate signals
-                    existing_signal = db.query(Signal).filter(
+                    existing_signal = db.query(Signal.id).filter(
                         Signal.company_id == company.id,
                         Signal.raw_text == signal_text
                     ).first()
@@ -363,8 +393,7 @@ class ScrapingService:
             if company_data.get('description'):
                 company.description = company_data['description']
             if company_data.get('career_page_url'):
-                company.metadata = company.metadata or {}
-                company.metadata['career_page_url'] = company_data['career_page_url']
+                company.career_page_url = company_data['career_page_url']
 
             # Create contacts from emails
             for email in company_data.get('emails', [])[:5]:  # Limit to 5
@@ -374,17 +403,24 @@ class ScrapingService:
             for phone in company_data.get('phones', [])[:5]:  # Limit to 5
                 self._get_or_create_contact(db, company, phone=phone)
 
-            # Process job signals
-            for job_signal in company_data.get('job_signals', []):
-                try:
-                    # Check for duplicate
-                    existing_signal = db.query(Signal).filter(
+            # Process job signals; texts already stored for this company are
+            # fetched in one column-only query instead of a lookup per signal
+            job_signals = company_data.get('job_signals', [])
+            seen_signals = set()
+            if job_signals:
+                seen_signals.update(db.scalars(
+                    select(Signal.raw_text).where(
                         Signal.company_id == company.id,
-                        Signal.raw_text == job_signal
-                    ).first()
+                        Signal.raw_text.in_(set(job_signals))
+                    )
+                ))
 
-                    if existing_signal:
+            for job_signal in job_signals:
+                try:
+                    # Check for duplicate
+                    if job_signal in seen_signals:
                         continue
+                    seen_signals.add(job_signal)
 
                     # Create signal
                     signal = Signal(
@@ -445,7 +481,7 @@ class ScrapingService:
                 return company
 
         # Try by name (case-insensitive)
-        company = query.filter(Company.name.ilike(name)).first()
+        company = query.filter(func.lower(Company.name) == name.lower()).first()
         if company:
             # Update website if provided and not set
             if website and not company.website:
@@ -453,14 +489,17 @@ class ScrapingService:
                 db.flush()
             return company
 
-        # Create new company
-        company = Company(
-            name=name,
-            website=website
-        )
-        db.add(company)
-        db.flush()
-        return company
+        # Create new company. Companies are imported concurrently, so another
+        # import may create it first; the conflict is skipped and its row used
+        company_id = db.execute(
+            company_insert(db).values(name=name, website=website).returning(Company.id)
+        ).scalar()
+        if company_id is None:
+            lookup = func.lower(Company.name) == name.lower()
+            if website:
+                lookup = or_(lookup, Company.website == website)
+            company_id = db.execute(select(Company.id).where(lookup).limit(1)).scalar()
+        return db.get(Company, company_id)
 
     def _get_or_create_contact(
         self,
@@ -272,6 +272,14 @@ class NitterScraper(SocialMediaScraper):
 # Helper Functions
 # ============================================================================
 
+# All hiring keywords in one alternation, compiled once, so each post is scanned
+# in a single pass instead of once per keyword
+_HIRING_POST_PATTERN = re.compile(
+    r'\b(?:hiring|recruiting|job\s+opening|we\'re\s+looking\s+for|join\s+our\s+team'
+    r'|marketing\s+manager|marketing\s+lead|growth\s+hacker|digital\s+marketing|open\s+position)\b',
+    re.IGNORECASE,
+)
+
 def filter_hiring_posts(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Filter posts to only include those likely related to hiring or marketing pain.
@@ -282,24 +290,7 @@ def filter_hiring_posts(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     Returns:
         Filtered list of posts
     """
-    hiring_keywords = [
-        r'\bhiring\b', r'\brecruiting\b', r'\bjob\s+opening\b', r'\bwe\'re\s+looking\s+for\b',
-        r'\bjoin\s+our\s+team\b', r'\bmarketing\s+manager\b', r'\bmarketing\s+lead\b',
-        r'\bgrowth\s+hacker\b', r'\bdigital\s+marketing\b', r'\bopen\s+position\b',
-    ]
-
-    filtered = []
-
-    for post in posts:
-        text = post.get('text', '').lower()
-
-        # Check if post matches hiring keywords
-        for keyword_pattern in hiring_keywords:
-            if re.search(keyword_pattern, text, re.IGNORECASE):
-                filtered.append(post)
-                break
-
-    return filtered
+    return [post for post in posts if _HIRING_POST_PATTERN.search(post.get('text', ''))]
 
 
 def social_post_to_signal_text(post: Dict[str, Any]) -> str:
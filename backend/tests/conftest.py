@@ -0,0 +1,25 @@
+"""Shared fixtures: backend modules importable, and a throwaway SQLite database."""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# database.py builds its engine from DATABASE_URL at import time
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+
+from database import Base, SessionLocal, engine, init_db  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """A session on freshly created tables."""
+    Base.metadata.drop_all(bind=engine)
+    init_db(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
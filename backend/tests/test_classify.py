@@ -0,0 +1,87 @@
+"""Batch classification endpoint and company resolution."""
+
+import asyncio
+
+import pytest
+
+from config import get_settings
+from database import Company, Lead
+from routers import classify
+from routers.classify import SignalInput, get_or_create_company, resolve_company_ids
+
+
+class FakeOllama:
+    """Scores 'cold' texts 0 and everything else 70; fails any prompt containing 'boom'."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def classify_signals_batch(self, texts, icp_context, use_cache=True, icp_key=None):
+        self.prompts.append(list(texts))
+        if any("boom" in text for text in texts):
+            raise RuntimeError("model crashed")
+        return [
+            {"icp_match": True, "score_fit": 0 if "cold" in text else 40, "score_pain": 0 if "cold" in text else 30}
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    fake = FakeOllama()
+    monkeypatch.setattr(classify, "get_ollama_manager", lambda: fake)
+    monkeypatch.setattr(get_settings(), "batch_prompt_size", 2)
+    return fake
+
+
+def test_batch_results_keep_input_order_and_map_errors(db, fake_ollama):
+    texts = ["hot lead A", "cold lead B", "boom C", "hot lead A", "hot lead D"]
+    signals = [SignalInput(signal_text=text) for text in texts]
+
+    response = asyncio.run(classify.classify_signals_batch(signals, stream=False, db=db))
+
+    results = response["results"]
+    assert [r["signal"] for r in results] == texts
+    # "boom C" shares its prompt with "hot lead D", so both fail; the
+    # duplicate "hot lead A" is classified once and gets its own lead
+    assert [r["status"] for r in results] == ["ok", "filtered", "error", "ok", "error"]
+    assert results[2]["error"] == results[4]["error"] == "model crashed"
+    assert sorted(sum(fake_ollama.prompts, [])) == sorted(set(texts))
+
+    lead_ids = [results[0]["lead_id"], results[3]["lead_id"]]
+    assert len(set(lead_ids)) == 2
+    assert db.query(Lead).count() == 2
+    assert {k: response[k] for k in ("count", "created_leads", "filtered", "errors")} == {
+        "count": 5, "created_leads": 2, "filtered": 1, "errors": 2,
+    }
+
+
+def test_resolve_company_ids_matches_and_creates_once(db):
+    acme = Company(name="Acme", website="acme.com")
+    db.add(acme)
+    db.commit()
+
+    signals = [
+        SignalInput(signal_text="a", company_name="ACME"),
+        SignalInput(signal_text="b", company_name="Beta", company_website="beta.io"),
+        SignalInput(signal_text="c", company_name="beta"),
+        SignalInput(signal_text="d", company_name="Gamma", company_website="acme.com"),
+        SignalInput(signal_text="e"),
+    ]
+
+    ids = resolve_company_ids(db, signals)
+
+    beta_id = db.query(Company.id).filter(Company.name == "Beta").scalar()
+    assert ids == [acme.id, beta_id, beta_id, acme.id, None]
+    assert db.query(Company).count() == 2
+
+
+def test_get_or_create_company_ignores_missing_websites(db):
+    other = Company(name="Other")
+    db.add(other)
+    db.commit()
+
+    company_id = get_or_create_company(db, SignalInput(signal_text="a", company_name="New Co"))
+
+    assert company_id is not None and company_id != other.id
+    assert get_or_create_company(db, SignalInput(signal_text="b", company_name="new co")) == company_id
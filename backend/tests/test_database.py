@@ -0,0 +1,76 @@
+"""init_db on a database created by an older version of the schema."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from database import init_db
+
+
+def create_old_database(path, rows=""):
+    """A SQLite file with an older companies/leads schema, filled by the `rows` INSERTs."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE companies (id INTEGER PRIMARY KEY, name VARCHAR, website VARCHAR UNIQUE);
+        CREATE TABLE leads (id INTEGER PRIMARY KEY, company_id INTEGER REFERENCES companies(id));
+    """ + rows)
+    conn.commit()
+    conn.close()
+    return create_engine(f"sqlite:///{path}")
+
+
+def test_init_db_adds_new_columns_to_existing_tables(tmp_path):
+    engine = create_old_database(tmp_path / "old.db", """
+        INSERT INTO companies (id, name, website) VALUES (1, 'Acme', 'acme.com');
+        INSERT INTO leads (id, company_id) VALUES (1, 1);
+    """)
+
+    init_db(engine)
+
+    inspector = inspect(engine)
+    assert {"career_page_url", "country", "updated_at"} <= {c["name"] for c in inspector.get_columns("companies")}
+    assert {"status", "total_score", "score_bucket"} <= {c["name"] for c in inspector.get_columns("leads")}
+    with engine.connect() as conn:
+        assert tuple(conn.execute(text("SELECT id, name, website FROM companies")).one()) == (1, "Acme", "acme.com")
+        assert conn.execute(text("SELECT company_id FROM leads")).scalar() == 1
+
+
+def test_init_db_is_idempotent(tmp_path):
+    engine = create_old_database(tmp_path / "old.db")
+
+    init_db(engine)
+    init_db(engine)
+
+    with engine.connect() as conn:
+        index_names = conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name IN ('companies', 'leads')")
+        ).scalars().all()
+    assert {"ix_companies_lower_name", "ix_leads_status_total_score", "ix_leads_score_bucket_total_score"} <= set(index_names)
+
+
+def test_init_db_merges_companies_differing_only_by_case(tmp_path):
+    engine = create_old_database(tmp_path / "old.db", """
+        INSERT INTO companies (id, name, website) VALUES (1, 'Acme', NULL), (2, 'ACME', 'acme.com'), (3, 'Beta', NULL);
+        INSERT INTO leads (id, company_id) VALUES (1, 1), (2, 2), (3, 3);
+    """)
+
+    init_db(engine)
+
+    with engine.connect() as conn:
+        companies = conn.execute(text("SELECT id, name, website FROM companies ORDER BY id")).all()
+        lead_companies = conn.execute(text("SELECT company_id FROM leads ORDER BY id")).scalars().all()
+    # The oldest row is kept, with the website only the merged row had
+    assert [tuple(row) for row in companies] == [(1, "Acme", "acme.com"), (3, "Beta", None)]
+    assert lead_companies == [1, 1, 3]
+
+
+def test_init_db_enforces_case_insensitive_company_names(tmp_path):
+    engine = create_old_database(tmp_path / "old.db", "INSERT INTO companies (name) VALUES ('Beta');")
+
+    init_db(engine)
+
+    with pytest.raises(IntegrityError):
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO companies (name) VALUES ('beta')"))
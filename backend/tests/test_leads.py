@@ -0,0 +1,32 @@
+"""Lead list keyset pagination."""
+
+import json
+
+from database import Company, Lead
+from routers.leads import list_leads
+
+
+def fetch_page(db, **cursor):
+    response = list_leads(
+        score_min=0, score_max=100, status=None, score_bucket=None,
+        limit=2, offset=0, db=db, **cursor,
+    )
+    return json.loads(response.body)
+
+
+def test_keyset_pages_cover_every_lead_once(db):
+    company = Company(name="Acme")
+    db.add(company)
+    db.flush()
+    db.add_all([Lead(company_id=company.id, total_score=score) for score in (50, 80, 90, 80, 80)])
+    db.commit()
+
+    pages = [fetch_page(db, after_score=None, after_id=None)]
+    while pages[-1]:
+        last = pages[-1][-1]
+        pages.append(fetch_page(db, after_score=last["total_score"], after_id=last["id"]))
+
+    seen = [(lead["total_score"], lead["id"]) for page in pages for lead in page]
+    expected = sorted(((lead.total_score, lead.id) for lead in db.query(Lead)), reverse=True)
+    assert seen == expected
+    assert [len(page) for page in pages] == [2, 2, 1, 0]
@@ -0,0 +1,47 @@
+"""Batch classification replies are routed to their signals."""
+
+import json
+
+import pytest
+
+from ollama_wrapper import OllamaManager
+
+
+@pytest.fixture
+def manager():
+    return OllamaManager()
+
+
+def test_routes_objects_by_index(manager):
+    reply = json.dumps([{"index": 3, "score_fit": 30}, {"index": 1, "score_fit": 10}])
+
+    routed = manager._parse_json_array_response(reply, 3)
+
+    assert routed == [{"score_fit": 10}, None, {"score_fit": 30}]
+
+
+def test_positional_array_needs_every_signal(manager):
+    assert manager._parse_json_array_response(json.dumps([{"a": 1}, {"a": 2}]), 2) == [{"a": 1}, {"a": 2}]
+    assert manager._parse_json_array_response(json.dumps([{"a": 1}]), 2) is None
+
+
+def test_out_of_range_or_repeated_indexes_fall_back_to_position(manager):
+    reply = json.dumps([{"index": 2, "a": 1}, {"index": 2, "a": 2}])
+    assert manager._parse_json_array_response(reply, 2) == [{"a": 1}, {"a": 2}]
+
+    reply = json.dumps([{"index": 5, "a": 1}])
+    assert manager._parse_json_array_response(reply, 2) is None
+
+
+def test_array_found_inside_wrapping_text_or_object(manager):
+    reply = 'Here you go: [{"index": 1, "a": 1}] done'
+    assert manager._parse_json_array_response(reply, 1) == [{"a": 1}]
+
+    reply = json.dumps({"results": [{"index": 1, "a": 1}]})
+    assert manager._parse_json_array_response(reply, 1) == [{"a": 1}]
+
+
+def test_unusable_reply(manager):
+    assert manager._parse_json_array_response("no json here", 2) is None
+    assert manager._parse_json_array_response("[]", 2) is None
+    assert manager._parse_json_array_response('["a", "b"]', 2) is None